@@ -1,4 +1,5 @@
 import asyncio
+import random
 import httpx
 from typing import Dict, List, Any, Optional, Union
 import json
@@ -6,41 +7,76 @@ from ..config import BASE_URL, TIMEOUT_SMALL, TIMEOUT_MEDIUM, TIMEOUT_LARGE, VER
 from ..util.logger import log_ssl_warning
 
 _RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Transport failures worth retrying — the request never reached StatCan or the
+# connection dropped mid-response. Other RequestErrors (bad URL, TLS) are not.
+_RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ReadTimeout, httpx.RemoteProtocolError)
 _MAX_RETRY_ATTEMPTS = 3
+_BACKOFF_INITIAL = 0.1  # seconds
+_BACKOFF_MAX = 2.0  # seconds
+# A throttled (429) request retried after ~100ms would almost certainly be
+# throttled again, so rate limits keep the longer 1s, 2s, ... schedule
+# unless StatCan says how long to wait via Retry-After.
+_RATE_LIMIT_BACKOFF_INITIAL = 1.0  # seconds
+_RATE_LIMIT_BACKOFF_MAX = 10.0  # seconds
 
 
-async def make_get_request(endpoint: str, params: Optional[Dict[str, Any]] = None,
-                           timeout: float = TIMEOUT_SMALL) -> Any:
-    """Make a GET request to the StatCan WDS API with retry on 5xx/429."""
-    if not VERIFY_SSL:
-        log_ssl_warning(f"SSL verification disabled for {endpoint}.")
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff (0.1s, 0.2s, 0.4s, ...) plus up to 100% random jitter."""
+    delay = min(_BACKOFF_INITIAL * (2 ** attempt), _BACKOFF_MAX)
+    return delay + random.uniform(0, delay)
+
+
+def _rate_limit_delay(response: httpx.Response, attempt: int) -> float:
+    """Delay before retrying a 429: Retry-After seconds if given, else 1s, 2s, 4s... (capped)."""
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):  # absent, or an HTTP-date
+        delay = _RATE_LIMIT_BACKOFF_INITIAL * (2 ** attempt)
+    return min(max(delay, 0.0), _RATE_LIMIT_BACKOFF_MAX)
+
+
+async def _request(method: str, url: str, *, base_url: str = "",
+                   timeout: float = TIMEOUT_SMALL, **kwargs: Any) -> httpx.Response:
+    """Send a request, retrying transient failures with jittered exponential backoff.
+
+    Retries connection errors, read timeouts, dropped connections and 5xx/429
+    responses up to _MAX_RETRY_ATTEMPTS times (429s wait per _rate_limit_delay).
+    Any other error, or the last failed attempt, propagates to the caller unchanged.
+    """
     for attempt in range(_MAX_RETRY_ATTEMPTS):
+        delay = _backoff_delay(attempt)
         try:
-            async with httpx.AsyncClient(base_url=BASE_URL, timeout=timeout, verify=VERIFY_SSL) as client:
-                response = await client.get(endpoint, params=params)
+            async with httpx.AsyncClient(base_url=base_url, timeout=timeout, verify=VERIFY_SSL) as client:
+                response = await client.request(method, url, **kwargs)
                 response.raise_for_status()
-                return response.json()
+                return response
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRY_ATTEMPTS - 1:
                 raise
-            await asyncio.sleep(min(1.0 * (2 ** attempt), 10.0))
+            if exc.response.status_code == 429:
+                delay = _rate_limit_delay(exc.response, attempt)
+        except _RETRY_EXCEPTIONS:
+            if attempt == _MAX_RETRY_ATTEMPTS - 1:
+                raise
+        await asyncio.sleep(delay)
+
+
+async def make_get_request(endpoint: str, params: Optional[Dict[str, Any]] = None,
+                           timeout: float = TIMEOUT_SMALL) -> Any:
+    """Make a GET request to the StatCan WDS API with retry on transient failures."""
+    if not VERIFY_SSL:
+        log_ssl_warning(f"SSL verification disabled for {endpoint}.")
+    response = await _request("GET", endpoint, base_url=BASE_URL, timeout=timeout, params=params)
+    return response.json()
 
 
 async def make_post_request(endpoint: str, data: Union[List[Dict[str, Any]], Dict[str, Any]],
                             timeout: float = TIMEOUT_SMALL) -> Any:
-    """Make a POST request to the StatCan WDS API with retry on 5xx/429."""
+    """Make a POST request to the StatCan WDS API with retry on transient failures."""
     if not VERIFY_SSL:
         log_ssl_warning(f"SSL verification disabled for {endpoint}.")
-    for attempt in range(_MAX_RETRY_ATTEMPTS):
-        try:
-            async with httpx.AsyncClient(base_url=BASE_URL, timeout=timeout, verify=VERIFY_SSL) as client:
-                response = await client.post(endpoint, json=data)
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRY_ATTEMPTS - 1:
-                raise
-            await asyncio.sleep(min(1.0 * (2 ** attempt), 10.0))
+    response = await _request("POST", endpoint, base_url=BASE_URL, timeout=timeout, json=data)
+    return response.json()
 
 
 async def make_sdmx_get(
@@ -50,19 +86,10 @@ async def make_sdmx_get(
     params: Optional[Dict[str, Any]] = None,
     timeout: float = TIMEOUT_MEDIUM,
 ) -> httpx.Response:
-    """GET request to an SDMX endpoint with retry on 5xx/429. Returns raw response."""
+    """GET request to an SDMX endpoint with retry on transient failures. Returns raw response."""
     if not VERIFY_SSL:
         log_ssl_warning(f"SSL verification disabled for {url}.")
-    for attempt in range(_MAX_RETRY_ATTEMPTS):
-        try:
-            async with httpx.AsyncClient(timeout=timeout, verify=VERIFY_SSL) as client:
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                return response
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRY_ATTEMPTS - 1:
-                raise
-            await asyncio.sleep(min(1.0 * (2 ** attempt), 10.0))
+    return await _request("GET", url, timeout=timeout, params=params, headers=headers)
 
 def extract_success_object(result_list: List[Dict[str, Any]], index: int = 0) -> Dict[str, Any]:
     """Extract the 'object' from a successful API response."""
@@ -1,14 +1,47 @@
+import asyncio
 import httpx
 import sqlite3
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
 from ..util.registry import ToolRegistry
-from ..config import BASE_URL, TIMEOUT_LARGE, TIMEOUT_MEDIUM, VERIFY_SSL
-from ..util.logger import log_ssl_warning, log_data_validation_warning
+from .client import make_get_request, make_post_request
+from ..config import TIMEOUT_LARGE, TIMEOUT_MEDIUM
+from ..util.logger import log_data_validation_warning
 from ..db.connection import get_db_connection
 from ..db.schema import create_table_from_data
-from ..models.db_models import TableDataInput
+from ..models.db_models import CreateTableInput
+
+# Schema for the shared cube metadata tables. The drill-down queries and the
+# per-pid DELETEs filter on pid / pid + dim_index, hence the indexes.
+_METADATA_SCHEMA_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS "_statcan_dimensions" (
+        pid INTEGER,
+        dim_index INTEGER,
+        dim_name_en TEXT,
+        dim_name_fr TEXT,
+        member_count INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS "_statcan_members" (
+        pid INTEGER,
+        dim_index INTEGER,
+        member_id INTEGER,
+        member_name_en TEXT,
+        member_name_fr TEXT,
+        vector_id TEXT,
+        classification_code TEXT
+    )
+    """,
+    'CREATE INDEX IF NOT EXISTS "idx__statcan_dimensions_pid" ON "_statcan_dimensions" (pid)',
+    'CREATE INDEX IF NOT EXISTS "idx__statcan_members_pid_dim" ON "_statcan_members" (pid, dim_index)',
+)
+_DELETE_DIMENSIONS_SQL = 'DELETE FROM "_statcan_dimensions" WHERE pid = ?'
+_DELETE_MEMBERS_SQL = 'DELETE FROM "_statcan_members" WHERE pid = ?'
+_INSERT_DIMENSION_SQL = 'INSERT INTO "_statcan_dimensions" VALUES (?,?,?,?,?)'
+_INSERT_MEMBER_SQL = 'INSERT INTO "_statcan_members" VALUES (?,?,?,?,?,?,?)'
 
 
 class StoreCubeMetadataInput(BaseModel):
@@ -93,16 +126,14 @@ def register_composite_tools(registry: ToolRegistry):
             params["endReferencePeriod"] = input_data.endRefPeriod
 
         # Fetch data from StatCan API
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_LARGE, verify=VERIFY_SSL) as client:
-            log_ssl_warning(f"SSL verification disabled for fetch_vectors_to_database.")
-            try:
-                response = await client.get("/getDataFromVectorByReferencePeriodRange", params=params)
-                response.raise_for_status()
-                result_list = response.json()
-            except httpx.RequestError as exc:
-                return {"error": f"Network error fetching vectors: {exc}"}
-            except Exception as exc:
-                return {"error": f"Unexpected error fetching vectors: {exc}"}
+        try:
+            result_list = await make_get_request(
+                "/getDataFromVectorByReferencePeriodRange", params=params, timeout=TIMEOUT_LARGE
+            )
+        except httpx.RequestError as exc:
+            return {"error": f"Network error fetching vectors: {exc}"}
+        except Exception as exc:
+            return {"error": f"Unexpected error fetching vectors: {exc}"}
 
         # Process the response — flatten each vector's data points
         flat_rows: List[Dict[str, Any]] = []
@@ -142,7 +173,10 @@ def register_composite_tools(registry: ToolRegistry):
             }
 
         # Store in SQLite via create_table_from_data (creates + inserts in one shot)
-        db_result = create_table_from_data(TableDataInput(table_name=table_name, data=flat_rows))
+        # Off the event loop — a large insert would otherwise stall other requests
+        db_result = await asyncio.to_thread(
+            create_table_from_data, CreateTableInput(table_name=table_name, data=flat_rows)
+        )
 
         if "error" in db_result:
             return {
@@ -193,14 +227,12 @@ def register_composite_tools(registry: ToolRegistry):
         """
         pid = input_data.productId
 
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning(f"SSL verification disabled for store_cube_metadata pid={pid}.")
-            try:
-                response = await client.post("/getCubeMetadata", json=[{"productId": pid}])
-                response.raise_for_status()
-                result_list = response.json()
-            except httpx.RequestError as exc:
-                return {"error": f"Network error fetching cube metadata: {exc}"}
+        try:
+            result_list = await make_post_request(
+                "/getCubeMetadata", [{"productId": pid}], timeout=TIMEOUT_MEDIUM
+            )
+        except httpx.RequestError as exc:
+            return {"error": f"Network error fetching cube metadata: {exc}"}
 
         if not (isinstance(result_list, list) and result_list and result_list[0].get("status") == "SUCCESS"):
             msg = result_list[0].get("object") if result_list else "Unknown error"
@@ -209,65 +241,43 @@ def register_composite_tools(registry: ToolRegistry):
         metadata = result_list[0]["object"]
         dimensions = metadata.get("dimension", [])
 
+        # Rows are built directly as insert-ready tuples, in table column order
         dim_rows = [
-            {
-                "pid": pid,
-                "dim_index": i,
-                "dim_name_en": dim.get("dimensionNameEn"),
-                "dim_name_fr": dim.get("dimensionNameFr"),
-                "member_count": len(dim.get("member", [])),
-            }
+            (pid, i, dim.get("dimensionNameEn"), dim.get("dimensionNameFr"), len(dim.get("member", [])))
             for i, dim in enumerate(dimensions)
         ]
 
         member_rows = [
-            {
-                "pid": pid,
-                "dim_index": i,
-                "member_id": member.get("memberId"),
-                "member_name_en": member.get("memberNameEn"),
-                "member_name_fr": member.get("memberNameFr"),
-                "vector_id": str(member["vectorId"]) if member.get("vectorId") is not None else None,
-                "classification_code": member.get("classificationCode"),
-            }
+            (
+                pid,
+                i,
+                member.get("memberId"),
+                member.get("memberNameEn"),
+                member.get("memberNameFr"),
+                str(member["vectorId"]) if member.get("vectorId") is not None else None,
+                member.get("classificationCode"),
+            )
             for i, dim in enumerate(dimensions)
             for member in dim.get("member", [])
         ]
 
-        try:
+        def _write_metadata_tables() -> None:
             with get_db_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS "_statcan_dimensions" (
-                        pid INTEGER,
-                        dim_index INTEGER,
-                        dim_name_en TEXT,
-                        dim_name_fr TEXT,
-                        member_count INTEGER
-                    )
-                """)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS "_statcan_members" (
-                        pid INTEGER,
-                        dim_index INTEGER,
-                        member_id INTEGER,
-                        member_name_en TEXT,
-                        member_name_fr TEXT,
-                        vector_id TEXT,
-                        classification_code TEXT
-                    )
-                """)
-                cursor.execute('DELETE FROM "_statcan_dimensions" WHERE pid = ?', (pid,))
-                cursor.execute('DELETE FROM "_statcan_members" WHERE pid = ?', (pid,))
-                cursor.executemany(
-                    'INSERT INTO "_statcan_dimensions" VALUES (?,?,?,?,?)',
-                    [(r["pid"], r["dim_index"], r["dim_name_en"], r["dim_name_fr"], r["member_count"]) for r in dim_rows],
-                )
-                cursor.executemany(
-                    'INSERT INTO "_statcan_members" VALUES (?,?,?,?,?,?,?)',
-                    [(r["pid"], r["dim_index"], r["member_id"], r["member_name_en"], r["member_name_fr"], r["vector_id"], r["classification_code"]) for r in member_rows],
-                )
+                # One transaction for the whole refresh (DDL would otherwise autocommit)
+                cursor.execute("BEGIN IMMEDIATE")
+                # IF NOT EXISTS makes this a cheap no-op once the tables exist, and
+                # running it every time recreates them if they were dropped
+                for statement in _METADATA_SCHEMA_SQL:
+                    cursor.execute(statement)
+                cursor.execute(_DELETE_DIMENSIONS_SQL, (pid,))
+                cursor.execute(_DELETE_MEMBERS_SQL, (pid,))
+                cursor.executemany(_INSERT_DIMENSION_SQL, dim_rows)
+                cursor.executemany(_INSERT_MEMBER_SQL, member_rows)
                 conn.commit()
+
+        try:
+            await asyncio.to_thread(_write_metadata_tables)
         except sqlite3.Error as exc:
             return {"error": f"SQLite error storing cube metadata: {exc}"}
 
@@ -276,8 +286,8 @@ def register_composite_tools(registry: ToolRegistry):
             "pid": pid,
             "cube_title_en": metadata.get("cubeTitleEn"),
             "dimensions": [
-                {"dim_index": r["dim_index"], "dim_name_en": r["dim_name_en"], "member_count": r["member_count"]}
-                for r in dim_rows
+                {"dim_index": dim_index, "dim_name_en": dim_name_en, "member_count": member_count}
+                for _, dim_index, dim_name_en, _, member_count in dim_rows
             ],
             "total_members_stored": len(member_rows),
             "next_steps": [
@@ -5,10 +5,11 @@ from typing import Dict, Any, List, Union
 
 import httpx
 
-from ...config import BASE_URL, TIMEOUT_LARGE, VERIFY_SSL
+from ..client import make_get_request
+from ...config import TIMEOUT_LARGE
 from ...models.api_models import CubeListInput, CubeSearchInput
-from ...util.cache import get_cached_cubes_list_lite
-from ...util.logger import log_ssl_warning, log_search_progress, log_data_validation_warning
+from ...util.cache import get_cached_cube_title_index
+from ...util.logger import log_search_progress, log_data_validation_warning
 from ...util.registry import ToolRegistry
 from ...util.truncation import truncate_response
 
@@ -18,10 +19,7 @@ def register_cube_discovery_tools(registry: ToolRegistry):
 
     async def _fetch_all_cubes_list_lite_raw() -> List[Dict[str, Any]]:
         """Raw API fetch for cache use — returns full unpaginated list."""
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_LARGE, verify=VERIFY_SSL) as client:
-            response = await client.get("/getAllCubesListLite")
-            response.raise_for_status()
-            return response.json()
+        return await make_get_request("/getAllCubesListLite", timeout=TIMEOUT_LARGE)
 
     @registry.tool()
     async def get_all_cubes_list(list_input: CubeListInput) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -36,17 +34,13 @@ def register_cube_discovery_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For cubes, this means including the ProductId (pid) and the Title.
         """
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_LARGE, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_all_cubes_list.")
-            try:
-                response = await client.get("/getAllCubesList")
-                response.raise_for_status()
-                all_cubes = response.json()
-                return truncate_response(all_cubes, list_input.offset, list_input.limit)
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_all_cubes_list: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_all_cubes_list: {exc}")
+        try:
+            all_cubes = await make_get_request("/getAllCubesList", timeout=TIMEOUT_LARGE)
+            return truncate_response(all_cubes, list_input.offset, list_input.limit)
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_all_cubes_list: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_all_cubes_list: {exc}")
 
     @registry.tool()
     async def get_all_cubes_list_lite(list_input: CubeListInput) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -61,17 +55,13 @@ def register_cube_discovery_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For cubes, this means including the ProductId (pid) and the Title.
         """
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_LARGE, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_all_cubes_list_lite.")
-            try:
-                response = await client.get("/getAllCubesListLite")
-                response.raise_for_status()
-                all_cubes = response.json()
-                return truncate_response(all_cubes, list_input.offset, list_input.limit)
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_all_cubes_list_lite: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_all_cubes_list_lite: {exc}")
+        try:
+            all_cubes = await make_get_request("/getAllCubesListLite", timeout=TIMEOUT_LARGE)
+            return truncate_response(all_cubes, list_input.offset, list_input.limit)
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_all_cubes_list_lite: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_all_cubes_list_lite: {exc}")
 
     @registry.tool()
     async def search_cubes_by_title(search_input: CubeSearchInput) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -95,14 +85,11 @@ def register_cube_discovery_tools(registry: ToolRegistry):
         max_results = search_input.max_results
         log_search_progress(f"Searching for cubes with title containing: '{search_term}'")
 
-        all_cubes_lite = await get_cached_cubes_list_lite(_fetch_all_cubes_list_lite_raw)
+        title_index = await get_cached_cube_title_index(_fetch_all_cubes_list_lite_raw)
 
         search_terms = search_term.lower().split()
         matching_cubes = []
-        for cube in all_cubes_lite:
-            title_en = (cube.get("cubeTitleEn", "") or "").lower()
-            title_fr = (cube.get("cubeTitleFr", "") or "").lower()
-
+        for cube, title_en, title_fr in title_index:
             match_en = all(term in title_en for term in search_terms)
             match_fr = all(term in title_fr for term in search_terms)
 
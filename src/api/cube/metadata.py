@@ -4,9 +4,9 @@ from typing import Dict, Any
 
 import httpx
 
-from ...config import BASE_URL, TIMEOUT_MEDIUM, VERIFY_SSL
+from ..client import make_post_request
+from ...config import TIMEOUT_MEDIUM
 from ...models.api_models import CubeMetadataInput
-from ...util.logger import log_ssl_warning
 from ...util.registry import ToolRegistry
 from ...util.truncation import summarize_cube_metadata
 
@@ -39,22 +39,18 @@ def register_cube_metadata_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For cubes, this means including the ProductId (pid) and the Title.
         """
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_cube_metadata.")
-            post_data = [{"productId": metadata_input.productId}]
-            try:
-                response = await client.post("/getCubeMetadata", json=post_data)
-                response.raise_for_status()
-                result_list = response.json()
-                if result_list and isinstance(result_list, list) and len(result_list) > 0 and result_list[0].get("status") == "SUCCESS":
-                    metadata = result_list[0].get("object", {})
-                    if metadata_input.summary:
-                        return summarize_cube_metadata(metadata)
-                    return metadata
-                else:
-                    api_message = result_list[0].get("object") if (result_list and isinstance(result_list, list) and len(result_list) > 0) else "Unknown API Error or Malformed Response"
-                    raise ValueError(f"API did not return SUCCESS status for get_cube_metadata productId {metadata_input.productId}: {api_message}")
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_cube_metadata: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_cube_metadata: {exc}")
+        post_data = [{"productId": metadata_input.productId}]
+        try:
+            result_list = await make_post_request("/getCubeMetadata", post_data, timeout=TIMEOUT_MEDIUM)
+            if result_list and isinstance(result_list, list) and len(result_list) > 0 and result_list[0].get("status") == "SUCCESS":
+                metadata = result_list[0].get("object", {})
+                if metadata_input.summary:
+                    return summarize_cube_metadata(metadata)
+                return metadata
+            else:
+                api_message = result_list[0].get("object") if (result_list and isinstance(result_list, list) and len(result_list) > 0) else "Unknown API Error or Malformed Response"
+                raise ValueError(f"API did not return SUCCESS status for get_cube_metadata productId {metadata_input.productId}: {api_message}")
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_cube_metadata: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_cube_metadata: {exc}")
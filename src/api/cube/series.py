@@ -5,7 +5,8 @@ from typing import Dict, Any, List, Union
 
 import httpx
 
-from ...config import BASE_URL, TIMEOUT_MEDIUM, TIMEOUT_LARGE, VERIFY_SSL
+from ..client import make_get_request, make_post_request
+from ...config import TIMEOUT_MEDIUM, TIMEOUT_LARGE
 from ...models.api_models import (
     CubeCoordInput,
     CubeCoordLatestNInput,
@@ -16,7 +17,7 @@ from ...models.api_models import (
     DEFAULT_TRUNCATION_LIMIT,
 )
 from ...util.coordinate import pad_coordinate
-from ...util.logger import log_ssl_warning, log_data_validation_warning
+from ...util.logger import log_data_validation_warning
 from ...util.registry import ToolRegistry
 from ...util.truncation import truncate_with_guidance
 
@@ -58,27 +59,23 @@ def register_cube_series_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For cube data, this means including the ProductId (pid), Coordinate, and Reference Period.
         """
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_data_from_cube_pid_coord_and_latest_n_periods.")
-            padded_coord = pad_coordinate(input_data.coordinate)
-            post_data = [{
-                "productId": input_data.productId,
-                "coordinate": padded_coord,
-                "latestN": input_data.latestN
-            }]
-            try:
-                response = await client.post("/getDataFromCubePidCoordAndLatestNPeriods", json=post_data)
-                response.raise_for_status()
-                result_list = response.json()
-                if result_list and isinstance(result_list, list) and len(result_list) > 0 and result_list[0].get("status") == "SUCCESS":
-                    return result_list[0].get("object", {})
-                else:
-                    api_message = result_list[0].get("object") if (result_list and isinstance(result_list, list) and len(result_list) > 0) else "Unknown API Error or Malformed Response"
-                    raise ValueError(f"API did not return SUCCESS status for cube coord latest N: pid={input_data.productId}, coord={input_data.coordinate}: {api_message}")
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_data_from_cube_pid_coord_and_latest_n_periods: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_data_from_cube_pid_coord_and_latest_n_periods: {exc}")
+        padded_coord = pad_coordinate(input_data.coordinate)
+        post_data = [{
+            "productId": input_data.productId,
+            "coordinate": padded_coord,
+            "latestN": input_data.latestN
+        }]
+        try:
+            result_list = await make_post_request("/getDataFromCubePidCoordAndLatestNPeriods", post_data, timeout=TIMEOUT_MEDIUM)
+            if result_list and isinstance(result_list, list) and len(result_list) > 0 and result_list[0].get("status") == "SUCCESS":
+                return result_list[0].get("object", {})
+            else:
+                api_message = result_list[0].get("object") if (result_list and isinstance(result_list, list) and len(result_list) > 0) else "Unknown API Error or Malformed Response"
+                raise ValueError(f"API did not return SUCCESS status for cube coord latest N: pid={input_data.productId}, coord={input_data.coordinate}: {api_message}")
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_data_from_cube_pid_coord_and_latest_n_periods: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_data_from_cube_pid_coord_and_latest_n_periods: {exc}")
 
     # @registry.tool()  # Deregistered: merged into get_series_info
     async def get_series_info_from_cube_pid_coord(input_data: CubeCoordInput) -> Dict[str, Any]:
@@ -98,26 +95,22 @@ def register_cube_series_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For series info, this means including the ProductId (pid) and Coordinate.
         """
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_series_info_from_cube_pid_coord.")
-            padded_coord = pad_coordinate(input_data.coordinate)
-            post_data = [{
-                "productId": input_data.productId,
-                "coordinate": padded_coord
-            }]
-            try:
-                response = await client.post("/getSeriesInfoFromCubePidCoord", json=post_data)
-                response.raise_for_status()
-                result_list = response.json()
-                if result_list and isinstance(result_list, list) and len(result_list) > 0 and result_list[0].get("status") == "SUCCESS":
-                    return result_list[0].get("object", {})
-                else:
-                    api_message = result_list[0].get("object") if (result_list and isinstance(result_list, list) and len(result_list) > 0) else "Unknown API Error or Malformed Response"
-                    raise ValueError(f"API did not return SUCCESS status for series info cube coord: pid={input_data.productId}, coord={input_data.coordinate}: {api_message}")
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_series_info_from_cube_pid_coord: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_series_info_from_cube_pid_coord: {exc}")
+        padded_coord = pad_coordinate(input_data.coordinate)
+        post_data = [{
+            "productId": input_data.productId,
+            "coordinate": padded_coord
+        }]
+        try:
+            result_list = await make_post_request("/getSeriesInfoFromCubePidCoord", post_data, timeout=TIMEOUT_MEDIUM)
+            if result_list and isinstance(result_list, list) and len(result_list) > 0 and result_list[0].get("status") == "SUCCESS":
+                return result_list[0].get("object", {})
+            else:
+                api_message = result_list[0].get("object") if (result_list and isinstance(result_list, list) and len(result_list) > 0) else "Unknown API Error or Malformed Response"
+                raise ValueError(f"API did not return SUCCESS status for series info cube coord: pid={input_data.productId}, coord={input_data.coordinate}: {api_message}")
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_series_info_from_cube_pid_coord: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_series_info_from_cube_pid_coord: {exc}")
 
     @registry.tool()
     async def get_changed_series_data_from_cube_pid_coord(input_data: CubeCoordInput) -> Dict[str, Any]:
@@ -137,26 +130,22 @@ def register_cube_series_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For changed series data, this means including the VectorId, ProductId (pid), and Coordinate.
         """
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_changed_series_data_from_cube_pid_coord.")
-            padded_coord = pad_coordinate(input_data.coordinate)
-            post_data = [{
-                "productId": input_data.productId,
-                "coordinate": padded_coord
-            }]
-            try:
-                response = await client.post("/getChangedSeriesDataFromCubePidCoord", json=post_data)
-                response.raise_for_status()
-                result_list = response.json()
-                if result_list and isinstance(result_list, list) and len(result_list) > 0 and result_list[0].get("status") == "SUCCESS":
-                    return result_list[0].get("object", {})
-                else:
-                    api_message = result_list[0].get("object") if (result_list and isinstance(result_list, list) and len(result_list) > 0) else "Unknown API Error or Malformed Response"
-                    raise ValueError(f"API did not return SUCCESS status for changed series cube coord: pid={input_data.productId}, coord={input_data.coordinate}: {api_message}")
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_changed_series_data_from_cube_pid_coord: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_changed_series_data_from_cube_pid_coord: {exc}")
+        padded_coord = pad_coordinate(input_data.coordinate)
+        post_data = [{
+            "productId": input_data.productId,
+            "coordinate": padded_coord
+        }]
+        try:
+            result_list = await make_post_request("/getChangedSeriesDataFromCubePidCoord", post_data, timeout=TIMEOUT_MEDIUM)
+            if result_list and isinstance(result_list, list) and len(result_list) > 0 and result_list[0].get("status") == "SUCCESS":
+                return result_list[0].get("object", {})
+            else:
+                api_message = result_list[0].get("object") if (result_list and isinstance(result_list, list) and len(result_list) > 0) else "Unknown API Error or Malformed Response"
+                raise ValueError(f"API did not return SUCCESS status for changed series cube coord: pid={input_data.productId}, coord={input_data.coordinate}: {api_message}")
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_changed_series_data_from_cube_pid_coord: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_changed_series_data_from_cube_pid_coord: {exc}")
 
     # DISABLED --- Bulk Download Tools ---
     #@mcp.tool()
@@ -178,25 +167,21 @@ def register_cube_series_tools(registry: ToolRegistry):
         if lang not in ['en', 'fr']:
             raise ValueError("Invalid language code. Use 'en' or 'fr'.")
 
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_full_table_download_csv.")
-            try:
-                response = await client.get(f"/getFullTableDownloadCSV/{productId}/{lang}")
-                response.raise_for_status()
-                result = response.json()
-                if isinstance(result, dict) and result.get("status") == "SUCCESS":
-                    download_url = result.get("object")
-                    if isinstance(download_url, str):
-                        return download_url
-                    else:
-                        raise ValueError(f"API returned unexpected object type for download URL: {download_url}")
+        try:
+            result = await make_get_request(f"/getFullTableDownloadCSV/{productId}/{lang}", timeout=TIMEOUT_MEDIUM)
+            if isinstance(result, dict) and result.get("status") == "SUCCESS":
+                download_url = result.get("object")
+                if isinstance(download_url, str):
+                    return download_url
                 else:
-                    api_message = result.get("object", "Unknown API Error") if isinstance(result, dict) else "Malformed Response"
-                    raise ValueError(f"API did not return SUCCESS status for get_full_table_download_csv productId {productId}: {api_message}")
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_full_table_download_csv: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_full_table_download_csv: {exc}")
+                    raise ValueError(f"API returned unexpected object type for download URL: {download_url}")
+            else:
+                api_message = result.get("object", "Unknown API Error") if isinstance(result, dict) else "Malformed Response"
+                raise ValueError(f"API did not return SUCCESS status for get_full_table_download_csv productId {productId}: {api_message}")
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_full_table_download_csv: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_full_table_download_csv: {exc}")
 
     # DISABLED --- Bulk Download Tools ---
     #@mcp.tool()
@@ -214,25 +199,21 @@ def register_cube_series_tools(registry: ToolRegistry):
         For full table downloads, this means including the ProductId (pid).
         """
         productId = product_input.productId
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_full_table_download_sdmx.")
-            try:
-                response = await client.get(f"/getFullTableDownloadSDMX/{productId}")
-                response.raise_for_status()
-                result = response.json()
-                if isinstance(result, dict) and result.get("status") == "SUCCESS":
-                    download_url = result.get("object")
-                    if isinstance(download_url, str):
-                        return download_url
-                    else:
-                        raise ValueError(f"API returned unexpected object type for download URL: {download_url}")
+        try:
+            result = await make_get_request(f"/getFullTableDownloadSDMX/{productId}", timeout=TIMEOUT_MEDIUM)
+            if isinstance(result, dict) and result.get("status") == "SUCCESS":
+                download_url = result.get("object")
+                if isinstance(download_url, str):
+                    return download_url
                 else:
-                    api_message = result.get("object", "Unknown API Error") if isinstance(result, dict) else "Malformed Response"
-                    raise ValueError(f"API did not return SUCCESS status for get_full_table_download_sdmx productId {productId}: {api_message}")
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_full_table_download_sdmx: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_full_table_download_sdmx: {exc}")
+                    raise ValueError(f"API returned unexpected object type for download URL: {download_url}")
+            else:
+                api_message = result.get("object", "Unknown API Error") if isinstance(result, dict) else "Malformed Response"
+                raise ValueError(f"API did not return SUCCESS status for get_full_table_download_sdmx productId {productId}: {api_message}")
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_full_table_download_sdmx: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_full_table_download_sdmx: {exc}")
 
     # @registry.tool()  # Deregistered: merged into get_series_info
     async def get_series_info_from_cube_pid_coord_bulk(input_data: BulkCubeCoordInput) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -245,44 +226,40 @@ def register_cube_series_tools(registry: ToolRegistry):
         if not input_data.items:
             raise ValueError("items list cannot be empty.")
 
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_series_info_from_cube_pid_coord_bulk.")
-            post_data = [
-                {"productId": item.productId, "coordinate": pad_coordinate(item.coordinate)}
-                for item in input_data.items
-            ]
-            try:
-                response = await client.post("/getSeriesInfoFromCubePidCoord", json=post_data)
-                response.raise_for_status()
-                result_list = response.json()
-
-                results = []
-                failures = []
-                if isinstance(result_list, list):
-                    for item in result_list:
-                        if isinstance(item, dict) and item.get("status") == "SUCCESS":
-                            results.append(item.get("object", {}))
-                        else:
-                            failures.append(item)
-                            log_data_validation_warning(f"Bulk series info partial failure: {item}")
-                else:
-                    raise ValueError(f"API response was not a list. Response: {result_list}")
-
-                if not results and failures:
-                    raise ValueError(f"API did not return SUCCESS for any item. Failures: {failures}")
-
-                offset = input_data.offset or 0
-                limit = input_data.limit or DEFAULT_TRUNCATION_LIMIT
-                return truncate_with_guidance(
-                    results, offset, limit,
-                    "Fields like scalarFactorCode, frequencyCode, and memberUomCode use StatCan "
-                    "numeric code values. Call get_code_sets() to resolve them to human-readable "
-                    "labels (e.g., frequency 6 = 'Monthly', scalar 0 = 'Units')."
-                )
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_series_info_from_cube_pid_coord_bulk: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_series_info_from_cube_pid_coord_bulk: {exc}")
+        post_data = [
+            {"productId": item.productId, "coordinate": pad_coordinate(item.coordinate)}
+            for item in input_data.items
+        ]
+        try:
+            result_list = await make_post_request("/getSeriesInfoFromCubePidCoord", post_data, timeout=TIMEOUT_MEDIUM)
+
+            results = []
+            failures = []
+            if isinstance(result_list, list):
+                for item in result_list:
+                    if isinstance(item, dict) and item.get("status") == "SUCCESS":
+                        results.append(item.get("object", {}))
+                    else:
+                        failures.append(item)
+                        log_data_validation_warning(f"Bulk series info partial failure: {item}")
+            else:
+                raise ValueError(f"API response was not a list. Response: {result_list}")
+
+            if not results and failures:
+                raise ValueError(f"API did not return SUCCESS for any item. Failures: {failures}")
+
+            offset = input_data.offset or 0
+            limit = input_data.limit or DEFAULT_TRUNCATION_LIMIT
+            return truncate_with_guidance(
+                results, offset, limit,
+                "Fields like scalarFactorCode, frequencyCode, and memberUomCode use StatCan "
+                "numeric code values. Call get_code_sets() to resolve them to human-readable "
+                "labels (e.g., frequency 6 = 'Monthly', scalar 0 = 'Units')."
+            )
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_series_info_from_cube_pid_coord_bulk: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_series_info_from_cube_pid_coord_bulk: {exc}")
 
     @registry.tool()
     async def get_series_info(input_data: BulkCubeCoordInput) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -311,44 +288,40 @@ def register_cube_series_tools(registry: ToolRegistry):
         if not input_data.items:
             raise ValueError("items list cannot be empty.")
 
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_series_info.")
-            post_data = [
-                {"productId": item.productId, "coordinate": pad_coordinate(item.coordinate)}
-                for item in input_data.items
-            ]
-            try:
-                response = await client.post("/getSeriesInfoFromCubePidCoord", json=post_data)
-                response.raise_for_status()
-                result_list = response.json()
-
-                results = []
-                failures = []
-                if isinstance(result_list, list):
-                    for item in result_list:
-                        if isinstance(item, dict) and item.get("status") == "SUCCESS":
-                            results.append(item.get("object", {}))
-                        else:
-                            failures.append(item)
-                            log_data_validation_warning(f"Series info partial failure: {item}")
-                else:
-                    raise ValueError(f"API response was not a list. Response: {result_list}")
-
-                if not results and failures:
-                    raise ValueError(f"API did not return SUCCESS for any item. Failures: {failures}")
-
-                offset = input_data.offset or 0
-                limit = input_data.limit or DEFAULT_TRUNCATION_LIMIT
-                return truncate_with_guidance(
-                    results, offset, limit,
-                    "Fields like scalarFactorCode, frequencyCode, and memberUomCode use StatCan "
-                    "numeric code values. Call get_code_sets() to resolve them to human-readable "
-                    "labels (e.g., frequency 6 = 'Monthly', scalar 0 = 'Units')."
-                )
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_series_info: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_series_info: {exc}")
+        post_data = [
+            {"productId": item.productId, "coordinate": pad_coordinate(item.coordinate)}
+            for item in input_data.items
+        ]
+        try:
+            result_list = await make_post_request("/getSeriesInfoFromCubePidCoord", post_data, timeout=TIMEOUT_MEDIUM)
+
+            results = []
+            failures = []
+            if isinstance(result_list, list):
+                for item in result_list:
+                    if isinstance(item, dict) and item.get("status") == "SUCCESS":
+                        results.append(item.get("object", {}))
+                    else:
+                        failures.append(item)
+                        log_data_validation_warning(f"Series info partial failure: {item}")
+            else:
+                raise ValueError(f"API response was not a list. Response: {result_list}")
+
+            if not results and failures:
+                raise ValueError(f"API did not return SUCCESS for any item. Failures: {failures}")
+
+            offset = input_data.offset or 0
+            limit = input_data.limit or DEFAULT_TRUNCATION_LIMIT
+            return truncate_with_guidance(
+                results, offset, limit,
+                "Fields like scalarFactorCode, frequencyCode, and memberUomCode use StatCan "
+                "numeric code values. Call get_code_sets() to resolve them to human-readable "
+                "labels (e.g., frequency 6 = 'Monthly', scalar 0 = 'Units')."
+            )
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_series_info: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_series_info: {exc}")
 
     @registry.tool()
     async def get_changed_cube_list(date: str) -> List[Dict[str, Any]]:
@@ -368,18 +341,14 @@ def register_cube_series_tools(registry: ToolRegistry):
         except ValueError:
             raise ValueError(f"Invalid date format for get_changed_cube_list. Expected YYYY-MM-DD, got {date}")
 
-        async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-            log_ssl_warning("SSL verification disabled for get_changed_cube_list.")
-            try:
-                response = await client.get(f"/getChangedCubeList/{date}")
-                response.raise_for_status()
-                result = response.json()
-                if isinstance(result, dict) and result.get("status") == "SUCCESS":
-                    return result.get("object", [])
-                else:
-                    api_message = result.get("object", "Unknown API Error") if isinstance(result, dict) else "Malformed Response"
-                    raise ValueError(f"API did not return SUCCESS status for get_changed_cube_list date {date}: {api_message}")
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_changed_cube_list: {exc}")
-            except ValueError as exc:
-                raise ValueError(f"Error processing response for get_changed_cube_list: {exc}")
+        try:
+            result = await make_get_request(f"/getChangedCubeList/{date}", timeout=TIMEOUT_MEDIUM)
+            if isinstance(result, dict) and result.get("status") == "SUCCESS":
+                return result.get("object", [])
+            else:
+                api_message = result.get("object", "Unknown API Error") if isinstance(result, dict) else "Malformed Response"
+                raise ValueError(f"API did not return SUCCESS status for get_changed_cube_list date {date}: {api_message}")
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_changed_cube_list: {exc}")
+        except ValueError as exc:
+            raise ValueError(f"Error processing response for get_changed_cube_list: {exc}")
@@ -136,8 +136,11 @@ def _find_ref_id(element: ET.Element) -> Optional[str]:
 
 def _parse_structure_xml(xml_text: str, product_id: int) -> Dict[str, Any]:
     """Parse SDMX 2.1 Structure XML into a JSON-serialisable summary dict."""
-    root = ET.fromstring(xml_text)
+    return _summarize_structure(ET.fromstring(xml_text), product_id)
 
+
+def _summarize_structure(root: ET.Element, product_id: int) -> Dict[str, Any]:
+    """Build the structure summary dict from an already-parsed SDMX 2.1 Structure root."""
     # ── Collect all codelists ───────────────────────────────────────────────
     codelists: Dict[str, List[Dict[str, Any]]] = {}
     codelist_names: Dict[str, str] = {}  # cl_id → English name
@@ -462,7 +465,9 @@ def register_sdmx_tools(registry: ToolRegistry) -> None:
         # Fetch the DSD and extract the codelist for the requested dimension
         structure_url = f"{SDMX_BASE_URL}structure/Data_Structure_{product_id}"
         response = await make_sdmx_get(structure_url, headers={"Accept": SDMX_XML_ACCEPT})
-        parsed = _parse_structure_xml(response.text, product_id)
+        # Parse once — the tree is reused below for the full (untruncated) codelist
+        root = ET.fromstring(response.text)
+        parsed = _summarize_structure(root, product_id)
         dimensions: List[Dict[str, Any]] = parsed.get("dimensions", [])
 
         # Find the dimension at the requested 1-based position
@@ -479,8 +484,7 @@ def register_sdmx_tools(registry: ToolRegistry) -> None:
                 f"Available positions: {available}. Call get_sdmx_structure to see them."
             )
 
-        # Re-parse the XML to get the FULL codelist (structure tool truncates at DEFAULT_MEMBER_LIMIT)
-        root = ET.fromstring(response.text)
+        # Walk the same tree for the FULL codelist (structure summary truncates at DEFAULT_MEMBER_LIMIT)
         cl_id = target_dim.get("codelist")
         all_codes: List[Dict[str, Any]] = []
         if cl_id:
@@ -11,8 +11,9 @@ from ...models.api_models import (
     BulkVectorRangeInput,
     DEFAULT_TRUNCATION_LIMIT,
 )
-from ...config import BASE_URL, TIMEOUT_MEDIUM, TIMEOUT_LARGE, VERIFY_SSL
-from ...util.logger import log_ssl_warning, log_data_validation_warning
+from ...config import TIMEOUT_MEDIUM, TIMEOUT_LARGE
+from ...util.logger import log_data_validation_warning
+from ..client import make_get_request, make_post_request
 from ...util.truncation import truncate_response
 
 
@@ -38,31 +39,25 @@ def register_vector_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For series info, this means including the VectorId, ProductId (pid), and Coordinate.
         """
-        async with httpx.AsyncClient(
-            base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL
-        ) as client:
-            log_ssl_warning(
-                "SSL verification disabled for get_series_info_from_vector."
-            )
-            post_data = [vector_input.model_dump()]
-            response = await client.post("/getSeriesInfoFromVector", json=post_data)
-            response.raise_for_status()
-            result_list = response.json()
-            if (
-                result_list
-                and isinstance(result_list, list)
-                and len(result_list) > 0
-                and result_list[0].get("status") == "SUCCESS"
-            ):
-                return result_list[0].get("object", {})
-            api_message = (
-                result_list[0].get("object")
-                if result_list and isinstance(result_list, list) and len(result_list) > 0
-                else "Unknown API Error or Malformed Response"
-            )
-            raise ValueError(
-                f"API did not return SUCCESS status for vectorId {vector_input.vectorId}: {api_message}"
-            )
+        post_data = [vector_input.model_dump()]
+        result_list = await make_post_request(
+            "/getSeriesInfoFromVector", post_data, timeout=TIMEOUT_MEDIUM
+        )
+        if (
+            result_list
+            and isinstance(result_list, list)
+            and len(result_list) > 0
+            and result_list[0].get("status") == "SUCCESS"
+        ):
+            return result_list[0].get("object", {})
+        api_message = (
+            result_list[0].get("object")
+            if result_list and isinstance(result_list, list) and len(result_list) > 0
+            else "Unknown API Error or Malformed Response"
+        )
+        raise ValueError(
+            f"API did not return SUCCESS status for vectorId {vector_input.vectorId}: {api_message}"
+        )
 
     # @registry.tool()  # Deregistered: replaced by get_sdmx_vector_data (server-side filtering)
     async def get_data_from_vectors_and_latest_n_periods(
@@ -83,48 +78,40 @@ def register_vector_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For vector data, this means including the VectorId and Reference Period.
         """
-        async with httpx.AsyncClient(
-            base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL
-        ) as client:
-            log_ssl_warning(
-                "SSL verification disabled for get_data_from_vectors_and_latest_n_periods."
+        # API expects a list containing one object
+        post_data = [vector_latest_n_input.model_dump()]
+        try:
+            result_list = await make_post_request(
+                "/getDataFromVectorsAndLatestNPeriods", post_data, timeout=TIMEOUT_MEDIUM
             )
-            # API expects a list containing one object
-            post_data = [vector_latest_n_input.model_dump()]
-            try:
-                response = await client.post(
-                    "/getDataFromVectorsAndLatestNPeriods", json=post_data
-                )
-                response.raise_for_status()
-                result_list = response.json()
-                if (
-                    result_list
-                    and isinstance(result_list, list)
-                    and len(result_list) > 0
-                    and result_list[0].get("status") == "SUCCESS"
-                ):
-                    return result_list[0].get("object", {})
-                else:
-                    api_message = (
-                        result_list[0].get("object")
-                        if (
-                            result_list
-                            and isinstance(result_list, list)
-                            and len(result_list) > 0
-                        )
-                        else "Unknown API Error or Malformed Response"
-                    )
-                    raise ValueError(
-                        f"API did not return SUCCESS status for vectorId {vector_latest_n_input.vectorId}: {api_message}"
+            if (
+                result_list
+                and isinstance(result_list, list)
+                and len(result_list) > 0
+                and result_list[0].get("status") == "SUCCESS"
+            ):
+                return result_list[0].get("object", {})
+            else:
+                api_message = (
+                    result_list[0].get("object")
+                    if (
+                        result_list
+                        and isinstance(result_list, list)
+                        and len(result_list) > 0
                     )
-            except httpx.RequestError as exc:
-                raise Exception(
-                    f"Network error calling get_data_from_vectors_and_latest_n_periods: {exc}"
+                    else "Unknown API Error or Malformed Response"
                 )
-            except ValueError as exc:
                 raise ValueError(
-                    f"Error processing response for get_data_from_vectors_and_latest_n_periods: {exc}"
+                    f"API did not return SUCCESS status for vectorId {vector_latest_n_input.vectorId}: {api_message}"
                 )
+        except httpx.RequestError as exc:
+            raise Exception(
+                f"Network error calling get_data_from_vectors_and_latest_n_periods: {exc}"
+            )
+        except ValueError as exc:
+            raise ValueError(
+                f"Error processing response for get_data_from_vectors_and_latest_n_periods: {exc}"
+            )
 
     # @registry.tool()  # Deregistered: replaced by get_sdmx_data/get_sdmx_vector_data with startPeriod/endPeriod
     async def get_data_from_vector_by_reference_period_range(
@@ -159,64 +146,55 @@ def register_vector_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For vector data, this means including the VectorId and Reference Period.
         """
-        async with httpx.AsyncClient(
-            base_url=BASE_URL, timeout=TIMEOUT_LARGE, verify=VERIFY_SSL
-        ) as client:  # Longer timeout
-            log_ssl_warning(
-                "SSL verification disabled for get_data_from_vector_by_reference_period_range."
-            )
-            # Parameters as defined in docs
-            params = {
-                "vectorIds": ",".join(range_input.vectorIds),
-            }
-            if range_input.startRefPeriod:
-                params["startRefPeriod"] = range_input.startRefPeriod
-            if range_input.endReferencePeriod:
-                params["endReferencePeriod"] = range_input.endReferencePeriod
-
-            try:
-                response = await client.get(
-                    "/getDataFromVectorByReferencePeriodRange", params=params
-                )
-                response.raise_for_status()
-                result_list = (
-                    response.json()
-                )  # API returns a list of status/object wrappers
-
-                processed_data = []
-                failures = []
-                if isinstance(result_list, list):
-                    for item in result_list:
-                        if isinstance(item, dict) and item.get("status") == "SUCCESS":
-                            processed_data.append(item.get("object", {}))
-                        else:
-                            failures.append(item)
-                            log_data_validation_warning(
-                                f"Failed to retrieve data for part of the range request: {item}"
-                            )
-                else:
-                    raise ValueError(
-                        f"API response was not a list for range request. Response: {result_list}"
-                    )
+        # Parameters as defined in docs
+        params = {
+            "vectorIds": ",".join(range_input.vectorIds),
+        }
+        if range_input.startRefPeriod:
+            params["startRefPeriod"] = range_input.startRefPeriod
+        if range_input.endReferencePeriod:
+            params["endReferencePeriod"] = range_input.endReferencePeriod
 
-                if not processed_data and failures:
-                    raise ValueError(
-                        f"API did not return SUCCESS status for any vector in range request. Failures: {failures}"
-                    )
+        try:
+            # API returns a list of status/object wrappers
+            result_list = await make_get_request(
+                "/getDataFromVectorByReferencePeriodRange", params=params, timeout=TIMEOUT_LARGE
+            )
 
-                # Smart truncation: return a preview with pagination guidance
-                offset = range_input.offset or 0
-                limit = range_input.limit or DEFAULT_TRUNCATION_LIMIT
-                return truncate_response(processed_data, offset, limit)
-            except httpx.RequestError as exc:
-                raise Exception(
-                    f"Network error calling get_data_from_vector_by_reference_period_range: {exc}"
+            processed_data = []
+            failures = []
+            if isinstance(result_list, list):
+                for item in result_list:
+                    if isinstance(item, dict) and item.get("status") == "SUCCESS":
+                        processed_data.append(item.get("object", {}))
+                    else:
+                        failures.append(item)
+                        log_data_validation_warning(
+                            f"Failed to retrieve data for part of the range request: {item}"
+                        )
+            else:
+                raise ValueError(
+                    f"API response was not a list for range request. Response: {result_list}"
                 )
-            except ValueError as exc:
+
+            if not processed_data and failures:
                 raise ValueError(
-                    f"Error processing response for get_data_from_vector_by_reference_period_range: {exc}"
+                    f"API did not return SUCCESS status for any vector in range request. Failures: {failures}"
                 )
 
+            # Smart truncation: return a preview with pagination guidance
+            offset = range_input.offset or 0
+            limit = range_input.limit or DEFAULT_TRUNCATION_LIMIT
+            return truncate_response(processed_data, offset, limit)
+        except httpx.RequestError as exc:
+            raise Exception(
+                f"Network error calling get_data_from_vector_by_reference_period_range: {exc}"
+            )
+        except ValueError as exc:
+            raise ValueError(
+                f"Error processing response for get_data_from_vector_by_reference_period_range: {exc}"
+            )
+
     @registry.tool()
     async def get_bulk_vector_data_by_range(
         bulk_range_input: BulkVectorRangeInput,
@@ -253,98 +231,88 @@ def register_vector_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For vector data, this means including the VectorId and Release Time.
         """
-        async with httpx.AsyncClient(
-            base_url=BASE_URL, timeout=TIMEOUT_LARGE, verify=VERIFY_SSL
-        ) as client:  # Longer timeout
-            log_ssl_warning(
-                "SSL verification disabled for get_bulk_vector_data_by_range."
+        # StatCan WDS expects an array of per-vector objects:
+        # [{"vectorId": 123, "startDataPointReleaseDate": "...", "endDataPointReleaseDate": "..."}]
+        # NOT a single flat object with a vectorIds array.
+        # Do NOT set explicit Accept/Content-Type headers — httpx sets Content-Type: application/json
+        # automatically when json= is used, and a strict Accept header can itself trigger 406.
+        per_vector: Dict[str, Any] = {}
+        if bulk_range_input.startDataPointReleaseDate:
+            per_vector["startDataPointReleaseDate"] = (
+                bulk_range_input.startDataPointReleaseDate
+            )
+        if bulk_range_input.endDataPointReleaseDate:
+            per_vector["endDataPointReleaseDate"] = (
+                bulk_range_input.endDataPointReleaseDate
+            )
+        post_data = [{"vectorId": vid, **per_vector} for vid in bulk_range_input.vectorIds]
+        try:
+            # API returns a list of status/object wrappers
+            result_list = await make_post_request(
+                "/getBulkVectorDataByRange", post_data, timeout=TIMEOUT_LARGE
             )
 
-            # StatCan WDS expects an array of per-vector objects:
-            # [{"vectorId": 123, "startDataPointReleaseDate": "...", "endDataPointReleaseDate": "..."}]
-            # NOT a single flat object with a vectorIds array.
-            # Do NOT set explicit Accept/Content-Type headers — httpx sets Content-Type: application/json
-            # automatically when json= is used, and a strict Accept header can itself trigger 406.
-            per_vector: Dict[str, Any] = {}
-            if bulk_range_input.startDataPointReleaseDate:
-                per_vector["startDataPointReleaseDate"] = (
-                    bulk_range_input.startDataPointReleaseDate
-                )
-            if bulk_range_input.endDataPointReleaseDate:
-                per_vector["endDataPointReleaseDate"] = (
-                    bulk_range_input.endDataPointReleaseDate
-                )
-            post_data = [{"vectorId": vid, **per_vector} for vid in bulk_range_input.vectorIds]
-            try:
-                response = await client.post(
-                    "/getBulkVectorDataByRange", json=post_data
-                )
-                response.raise_for_status()
-                result_list = (
-                    response.json()
-                )  # API returns a list of status/object wrappers
-
-                processed_data = []
-                failures = []
-                if isinstance(result_list, list):
-                    for item in result_list:
-                        if isinstance(item, dict) and item.get("status") == "SUCCESS":
-                            # Extract the object which contains vectorId and vectorDataPoint list
-                            object_data = item.get("object", {})
-
-                            vector_id = object_data.get("vectorId")
-                            product_id = object_data.get("productId")
-                            coordinate = object_data.get("coordinate")
-
-                            vector_points = object_data.get("vectorDataPoint", [])
-
-                            # Flattening logic: Inject vectorId and metadata into each data point
-                            if vector_id is not None and isinstance(
-                                vector_points, list
-                            ):
-                                for point in vector_points:
-                                    if isinstance(point, dict):
-                                        point["vectorId"] = vector_id
-                                        if product_id:
-                                            point["productId"] = product_id
-                                        if coordinate:
-                                            point["coordinate"] = coordinate
-                                        processed_data.append(point)
-                            else:
-                                # Fallback: if structure is unexpected, just log it.
-                                # We don't want to break the whole batch for one weird item,
-                                # but we also can't insert it without a vectorId/points list.
-                                log_data_validation_warning(
-                                    f"Unexpected structure for successful vector item: {item}"
-                                )
+            processed_data = []
+            failures = []
+            if isinstance(result_list, list):
+                for item in result_list:
+                    if isinstance(item, dict) and item.get("status") == "SUCCESS":
+                        # Extract the object which contains vectorId and vectorDataPoint list
+                        object_data = item.get("object", {})
+
+                        vector_id = object_data.get("vectorId")
+                        product_id = object_data.get("productId")
+                        coordinate = object_data.get("coordinate")
+
+                        vector_points = object_data.get("vectorDataPoint", [])
+
+                        # Flattening logic: Inject vectorId and metadata into each data point
+                        if vector_id is not None and isinstance(
+                            vector_points, list
+                        ):
+                            for point in vector_points:
+                                if isinstance(point, dict):
+                                    point["vectorId"] = vector_id
+                                    if product_id:
+                                        point["productId"] = product_id
+                                    if coordinate:
+                                        point["coordinate"] = coordinate
+                                    processed_data.append(point)
                         else:
-                            failures.append(item)
+                            # Fallback: if structure is unexpected, just log it.
+                            # We don't want to break the whole batch for one weird item,
+                            # but we also can't insert it without a vectorId/points list.
                             log_data_validation_warning(
-                                f"Failed to retrieve bulk data for part of the request: {item}"
+                                f"Unexpected structure for successful vector item: {item}"
                             )
-                else:
-                    raise ValueError(
-                        f"API response was not a list for bulk request. Response: {result_list}"
-                    )
-
-                if not processed_data and failures:
-                    raise ValueError(
-                        f"API did not return SUCCESS status for any vector in bulk request. Failures: {failures}"
-                    )
-
-                # Smart truncation: return a preview with pagination guidance
-                offset = bulk_range_input.offset or 0
-                limit = bulk_range_input.limit or DEFAULT_TRUNCATION_LIMIT
-                return truncate_response(processed_data, offset, limit)
-            except httpx.RequestError as exc:
-                raise Exception(
-                    f"Network error calling get_bulk_vector_data_by_range: {exc}"
+                    else:
+                        failures.append(item)
+                        log_data_validation_warning(
+                            f"Failed to retrieve bulk data for part of the request: {item}"
+                        )
+            else:
+                raise ValueError(
+                    f"API response was not a list for bulk request. Response: {result_list}"
                 )
-            except ValueError as exc:
+
+            if not processed_data and failures:
                 raise ValueError(
-                    f"Error processing response for get_bulk_vector_data_by_range: {exc}"
+                    f"API did not return SUCCESS status for any vector in bulk request. Failures: {failures}"
                 )
 
+            # Smart truncation: return a preview with pagination guidance
+            offset = bulk_range_input.offset or 0
+            limit = bulk_range_input.limit or DEFAULT_TRUNCATION_LIMIT
+            return truncate_response(processed_data, offset, limit)
+        except httpx.RequestError as exc:
+            raise Exception(
+                f"Network error calling get_bulk_vector_data_by_range: {exc}"
+            )
+        except ValueError as exc:
+            raise ValueError(
+                f"Error processing response for get_bulk_vector_data_by_range: {exc}"
+            )
+
     @registry.tool()
     async def get_changed_series_data_from_vector(
         vector_input: VectorIdInput,
@@ -364,48 +332,40 @@ def register_vector_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data.
         For changed series data, this means including the VectorId.
         """
-        async with httpx.AsyncClient(
-            base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL
-        ) as client:
-            log_ssl_warning(
-                "SSL verification disabled for get_changed_series_data_from_vector."
+        # API expects a list containing one object
+        post_data = [vector_input.model_dump()]
+        try:
+            result_list = await make_post_request(
+                "/getChangedSeriesDataFromVector", post_data, timeout=TIMEOUT_MEDIUM
             )
-            # API expects a list containing one object
-            post_data = [vector_input.model_dump()]
-            try:
-                response = await client.post(
-                    "/getChangedSeriesDataFromVector", json=post_data
-                )
-                response.raise_for_status()
-                result_list = response.json()
-                if (
-                    result_list
-                    and isinstance(result_list, list)
-                    and len(result_list) > 0
-                    and result_list[0].get("status") == "SUCCESS"
-                ):
-                    return result_list[0].get("object", {})
-                else:
-                    api_message = (
-                        result_list[0].get("object")
-                        if (
-                            result_list
-                            and isinstance(result_list, list)
-                            and len(result_list) > 0
-                        )
-                        else "Unknown API Error or Malformed Response"
-                    )
-                    raise ValueError(
-                        f"API did not return SUCCESS status for changed series vectorId {vector_input.vectorId}: {api_message}"
+            if (
+                result_list
+                and isinstance(result_list, list)
+                and len(result_list) > 0
+                and result_list[0].get("status") == "SUCCESS"
+            ):
+                return result_list[0].get("object", {})
+            else:
+                api_message = (
+                    result_list[0].get("object")
+                    if (
+                        result_list
+                        and isinstance(result_list, list)
+                        and len(result_list) > 0
                     )
-            except httpx.RequestError as exc:
-                raise Exception(
-                    f"Network error calling get_changed_series_data_from_vector: {exc}"
+                    else "Unknown API Error or Malformed Response"
                 )
-            except ValueError as exc:
                 raise ValueError(
-                    f"Error processing response for get_changed_series_data_from_vector: {exc}"
+                    f"API did not return SUCCESS status for changed series vectorId {vector_input.vectorId}: {api_message}"
                 )
+        except httpx.RequestError as exc:
+            raise Exception(
+                f"Network error calling get_changed_series_data_from_vector: {exc}"
+            )
+        except ValueError as exc:
+            raise ValueError(
+                f"Error processing response for get_changed_series_data_from_vector: {exc}"
+            )
 
     @registry.tool()
     async def get_changed_series_list(date: str) -> List[Dict[str, Any]]:
@@ -432,31 +392,26 @@ def register_vector_tools(registry: ToolRegistry):
                 f"Invalid date format for get_changed_series_list. Expected YYYY-MM-DD, got {date}"
             )
 
-        async with httpx.AsyncClient(
-            base_url=BASE_URL, timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL
-        ) as client:
-            log_ssl_warning("SSL verification disabled for get_changed_series_list.")
-            try:
-                response = await client.get(f"/getChangedSeriesList/{date}")
-                response.raise_for_status()
-                result = response.json()  # API returns a single status/object wrapper
-                if isinstance(result, dict) and result.get("status") == "SUCCESS":
-                    # The 'object' contains the list of changed series
-                    return result.get("object", [])
-                else:
-                    api_message = (
-                        result.get("object", "Unknown API Error")
-                        if isinstance(result, dict)
-                        else "Malformed Response"
-                    )
-                    raise ValueError(
-                        f"API did not return SUCCESS status for get_changed_series_list date {date}: {api_message}"
-                    )
-            except httpx.RequestError as exc:
-                raise Exception(f"Network error calling get_changed_series_list: {exc}")
-            except (
-                ValueError
-            ) as exc:  # Catch JSON decoding errors or our own ValueErrors
+        try:
+            # API returns a single status/object wrapper
+            result = await make_get_request(f"/getChangedSeriesList/{date}", timeout=TIMEOUT_MEDIUM)
+            if isinstance(result, dict) and result.get("status") == "SUCCESS":
+                # The 'object' contains the list of changed series
+                return result.get("object", [])
+            else:
+                api_message = (
+                    result.get("object", "Unknown API Error")
+                    if isinstance(result, dict)
+                    else "Malformed Response"
+                )
                 raise ValueError(
-                    f"Error processing response for get_changed_series_list: {exc}"
+                    f"API did not return SUCCESS status for get_changed_series_list date {date}: {api_message}"
                 )
+        except httpx.RequestError as exc:
+            raise Exception(f"Network error calling get_changed_series_list: {exc}")
+        except (
+            ValueError
+        ) as exc:  # Catch JSON decoding errors or our own ValueErrors
+            raise ValueError(
+                f"Error processing response for get_changed_series_list: {exc}"
+            )
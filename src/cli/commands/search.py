@@ -49,12 +49,17 @@ async def _search(term: str, max_results: int, fmt: str, output: Optional[str])
 
     search_terms = term.lower().split()
 
-    matching = [
-        cube
-        for cube in all_cubes
-        if all(t in (cube.get("cubeTitleEn", "") or "").lower() for t in search_terms)
-        or all(t in (cube.get("cubeTitleFr", "") or "").lower() for t in search_terms)
-    ]
+    # Lowercase each title once per cube, not once per search term; the French
+    # title is only needed when the English one doesn't match
+    matching = []
+    for cube in all_cubes:
+        title_en = (cube.get("cubeTitleEn") or "").lower()
+        if all(t in title_en for t in search_terms):
+            matching.append(cube)
+            continue
+        title_fr = (cube.get("cubeTitleFr") or "").lower()
+        if all(t in title_fr for t in search_terms):
+            matching.append(cube)
 
     total = len(matching)
     if total > max_results:
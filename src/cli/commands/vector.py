@@ -7,7 +7,13 @@ import httpx
 import typer
 from rich.progress import Progress
 
-from ...config import SDMX_BASE_URL, SDMX_JSON_ACCEPT, TIMEOUT_MEDIUM, VERIFY_SSL
+from ...config import (
+    MAX_CONCURRENT_REQUESTS,
+    SDMX_BASE_URL,
+    SDMX_JSON_ACCEPT,
+    TIMEOUT_MEDIUM,
+    VERIFY_SSL,
+)
 from ...util.sdmx_json import flatten_sdmx_json
 from ..output import err_console, normalize_vector_id, write_output
 
@@ -70,12 +76,13 @@ def vector(
         raise typer.Exit(1)
 
 
-async def _fetch_vector(vid: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def _fetch_vector(
+    client: httpx.AsyncClient, vid: str, params: Dict[str, Any]
+) -> List[Dict[str, Any]]:
     url = f"{SDMX_BASE_URL}vector/v{vid}"
-    async with httpx.AsyncClient(timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
-        response = await client.get(url, params=params, headers={"Accept": SDMX_JSON_ACCEPT})
-        response.raise_for_status()
-        return flatten_sdmx_json(response.json())
+    response = await client.get(url, params=params, headers={"Accept": SDMX_JSON_ACCEPT})
+    response.raise_for_status()
+    return flatten_sdmx_json(response.json())
 
 
 async def _vector(
@@ -96,21 +103,25 @@ async def _vector(
 
     all_rows: List[Dict[str, Any]] = []
 
-    if len(vector_ids) == 1:
-        with err_console.status(f"[bold green]Fetching v{vector_ids[0]}..."):
-            all_rows = await _fetch_vector(vector_ids[0], params)
-    else:
-        with Progress(console=err_console) as progress:
-            task = progress.add_task("Downloading vectors...", total=len(vector_ids))
-
-            async def fetch_and_advance(vid: str) -> List[Dict[str, Any]]:
-                rows = await _fetch_vector(vid, params)
-                progress.advance(task)
-                return rows
-
-            results = await asyncio.gather(*[fetch_and_advance(v) for v in vector_ids])
-            for rows in results:
-                all_rows.extend(rows)
+    # One client for every vector so requests reuse pooled connections
+    async with httpx.AsyncClient(timeout=TIMEOUT_MEDIUM, verify=VERIFY_SSL) as client:
+        if len(vector_ids) == 1:
+            with err_console.status(f"[bold green]Fetching v{vector_ids[0]}..."):
+                all_rows = await _fetch_vector(client, vector_ids[0], params)
+        else:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            with Progress(console=err_console) as progress:
+                task = progress.add_task("Downloading vectors...", total=len(vector_ids))
+
+                async def fetch_and_advance(vid: str) -> List[Dict[str, Any]]:
+                    async with semaphore:
+                        rows = await _fetch_vector(client, vid, params)
+                    progress.advance(task)
+                    return rows
+
+                results = await asyncio.gather(*[fetch_and_advance(v) for v in vector_ids])
+                for rows in results:
+                    all_rows.extend(rows)
 
     if not all_rows:
         err_console.print("[yellow]Warning: No observations returned[/yellow]")
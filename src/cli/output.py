@@ -94,13 +94,18 @@ def _filter_internal(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 
 def rows_to_csv(rows: List[Dict[str, Any]]) -> str:
-    """Convert a list of row dicts to a CSV string."""
+    """Convert a list of row dicts to a CSV string.
+
+    Columns are the union of all row keys in first-seen order; keys a row
+    lacks are written as empty cells.
+    """
     if not rows:
         return ""
+    fieldnames = list(dict.fromkeys(k for row in rows for k in row))
     out = io.StringIO()
-    writer = csv.DictWriter(out, fieldnames=rows[0].keys())
-    writer.writeheader()
-    writer.writerows(rows)
+    writer = csv.writer(out)
+    writer.writerow(fieldnames)
+    writer.writerows(map(row.get, fieldnames) for row in rows)
     return out.getvalue()
 
 
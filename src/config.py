@@ -1,8 +1,9 @@
 # Configuration parameters for the Statistics Canada API MCP Server
 
 import os
-import pwd as _pwd
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def _real_home() -> str:
     """Return the real user home directory from the OS passwd database.
 
@@ -11,33 +12,29 @@ def _real_home() -> str:
     the subprocess environment.
     """
     try:
-        return _pwd.getpwuid(os.getuid()).pw_dir
+        import pwd  # deferred: only needed when STATCAN_DB_FILE is not set
+        return pwd.getpwuid(os.getuid()).pw_dir
     except Exception:
-        return os.path.expanduser("~")  # last-resort fallback
+        return os.path.expanduser("~")  # last-resort fallback (incl. no pwd on Windows)
 
 
 # Database configuration
 # Use an explicit absolute path so the DB works regardless of the MCP server's
 # working directory (which varies by client — Claude Desktop, Cursor, etc.).
 # STATCAN_DB_FILE env var or --db-path CLI flag override the default.
-_default_db_dir = os.path.join(_real_home(), ".statcan-mcp")
-_default_db_path = os.path.join(_default_db_dir, "statcan_data.db")
-DB_FILE = os.environ.get("STATCAN_DB_FILE", _default_db_path)
-
-# Best-effort directory creation at import time.
-# get_db_connection() also does this defensively at connection time.
-_db_parent = os.path.dirname(DB_FILE)
-if _db_parent:
-    try:
-        os.makedirs(_db_parent, exist_ok=True)
-    except OSError:
-        pass  # Will be retried (with a real error) at connection time
+if "STATCAN_DB_FILE" in os.environ:
+    DB_FILE = os.environ["STATCAN_DB_FILE"]
+else:
+    DB_FILE = os.path.join(_real_home(), ".statcan-mcp", "statcan_data.db")
+# The parent directory is created lazily by get_db_connection(), so commands
+# that never touch the database (--help, search, vector) skip the mkdir.
 
 # API configuration
 BASE_URL = "https://www150.statcan.gc.ca/t1/wds/rest"
 TIMEOUT_SMALL = 30.0  # For simple queries
 TIMEOUT_MEDIUM = 60.0  # For list endpoints
 TIMEOUT_LARGE = 120.0  # For bulk data endpoints
+MAX_CONCURRENT_REQUESTS = 10  # Parallel fan-out cap; StatCan throttles at ~25 req/s per IP
 # Set STATCAN_VERIFY_SSL=false to disable verification on broken trust stores.
 VERIFY_SSL = os.environ.get("STATCAN_VERIFY_SSL", "true").lower() != "false"
 
@@ -1,33 +1,149 @@
+import atexit
 import os
 import sqlite3
+import threading
+from typing import Any, Callable, Dict, List, Optional
 from .. import config
+from ..util.sql_helpers import convert_value_for_sql
 
-def get_db_connection() -> sqlite3.Connection:
-    """Establishes a connection to the SQLite database.
+# Lists/dicts are bound as JSON text by sqlite3 itself, so the insert paths
+# pass values through untouched instead of converting every value in Python.
+sqlite3.register_adapter(list, convert_value_for_sql)
+sqlite3.register_adapter(dict, convert_value_for_sql)
 
-    Ensures the parent directory exists before connecting, so this works
-    regardless of whether config.py's import-time makedirs ran successfully
-    (e.g. in sandboxed MCP launchers or environments with altered HOME).
+# Parent directories already confirmed to exist, so warm connections skip the stat
+_ENSURED_DIRS: set = set()
+
+# journal_mode is persistent in the database file, so it only needs setting once
+# per path; the rest are per-connection and applied on every connect.
+_WAL_ENABLED: set = set()
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",   # safe with WAL; skips an fsync per commit
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MB — read hot pages without read() syscalls
+    "PRAGMA cache_size = -65536",    # 64 MB page cache
+)
+
+# One open connection per (thread, db path). Tools run in worker threads via
+# asyncio.to_thread, so each worker keeps its own connection instead of paying
+# for open + pragma setup on every call.
+_local = threading.local()
+_all_connections: List[sqlite3.Connection] = []
+_all_connections_lock = threading.Lock()
+_pool_generation = 0  # bumped by close_db_connections() to invalidate every thread's pool
+
+# In-memory and temporary ("") databases exist only inside the connection that
+# opened them, so a per-thread pool would give each worker its own empty
+# database. Those paths get one connection shared by every thread instead.
+_PRIVATE_DB_PATHS = ("", ":memory:")
+_shared_connections: Dict[str, "_SharedConnection"] = {}
+
+
+class _SharedConnection(sqlite3.Connection):
+    """A connection used by several threads, one ``with`` block at a time.
+
+    get_db_connection() takes the lock before handing it out and the ``with``
+    block releases it on exit, so one tool's transaction (and row_factory)
+    can't interleave with another's.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+
+    def __exit__(self, *exc_info: Any) -> Any:
+        try:
+            return super().__exit__(*exc_info)
+        finally:
+            self.lock.release()
+
+
+def get_db_connection(
+    row_factory: Optional[Callable[[sqlite3.Cursor, tuple], Any]] = None,
+) -> sqlite3.Connection:
+    """Returns this thread's pooled connection to the current config.DB_FILE.
+
+    The connection is opened on first use and reused afterwards; callers use
+    it as ``with get_db_connection() as conn:`` (commit/rollback) and must not
+    close it. Connections are closed at interpreter exit.
+
+    Rows come back as plain tuples unless a row_factory (e.g. sqlite3.Row) is
+    given; it is applied per call, since the pooled connection is shared by
+    every caller on this thread.
+
+    In-memory and temporary ("") databases get one connection for all threads
+    instead, locked until the ``with`` block exits.
+    """
+    db_path = config.DB_FILE
+    if db_path in _PRIVATE_DB_PATHS:
+        with _all_connections_lock:
+            conn = _shared_connections.get(db_path)
+            if conn is None:
+                conn = _shared_connections[db_path] = _open_connection(db_path, factory=_SharedConnection)
+                _all_connections.append(conn)
+        conn.lock.acquire()
+        conn.row_factory = row_factory
+        return conn
+
+    pool: Dict[str, sqlite3.Connection] = getattr(_local, "connections", None)
+    if pool is None or _local.generation != _pool_generation:
+        pool = _local.connections = {}
+        _local.generation = _pool_generation
+    conn = pool.get(db_path)
+    if conn is None:
+        conn = pool[db_path] = _open_connection(db_path)
+        with _all_connections_lock:
+            _all_connections.append(conn)
+    conn.row_factory = row_factory
+    return conn
+
+
+@atexit.register
+def close_db_connections() -> None:
+    """Closes every pooled connection (all threads) and empties the pool."""
+    global _pool_generation
+    with _all_connections_lock:
+        for conn in _all_connections:
+            conn.close()
+        _all_connections.clear()
+        _shared_connections.clear()
+        _pool_generation += 1
+
+
+def _open_connection(db_path: str, factory: type = sqlite3.Connection) -> sqlite3.Connection:
+    """Opens a new connection to db_path.
+
+    Ensures the parent directory exists before connecting (once per directory
+    per process), so this works even in sandboxed MCP launchers or
+    environments with altered HOME where the directory was never created.
 
     Raises sqlite3.OperationalError with the actual DB path in the message
     so failures are easy to diagnose in MCP tool error responses.
     """
-    db_path = config.DB_FILE
     parent_dir = os.path.dirname(db_path)
-    if parent_dir:
-        try:
-            os.makedirs(parent_dir, exist_ok=True)
-        except OSError as exc:
-            raise sqlite3.OperationalError(
-                f"Cannot create database directory '{parent_dir}': {exc}. "
-                f"Set STATCAN_DB_FILE env var or use --db-path to override."
-            ) from exc
+    if parent_dir and parent_dir not in _ENSURED_DIRS:
+        if not os.path.isdir(parent_dir):
+            try:
+                os.makedirs(parent_dir, exist_ok=True)
+            except OSError as exc:
+                raise sqlite3.OperationalError(
+                    f"Cannot create database directory '{parent_dir}': {exc}. "
+                    f"Set STATCAN_DB_FILE env var or use --db-path to override."
+                ) from exc
+        _ENSURED_DIRS.add(parent_dir)
     try:
-        conn = sqlite3.connect(db_path)
+        # check_same_thread=False so close_db_connections() can close every
+        # thread's connection at exit, and so a _SharedConnection can be shared.
+        conn = sqlite3.connect(db_path, check_same_thread=False, factory=factory)
     except sqlite3.OperationalError as exc:
         raise sqlite3.OperationalError(
             f"Cannot open database at '{db_path}': {exc}. "
             f"Set STATCAN_DB_FILE env var or pass --db-path to statcan-mcp-server."
         ) from exc
-    conn.row_factory = sqlite3.Row
+    # In-memory and temporary ("") databases have no file to journal to
+    if db_path not in _WAL_ENABLED and db_path not in _PRIVATE_DB_PATHS:
+        conn.execute("PRAGMA journal_mode = WAL")
+        _WAL_ENABLED.add(db_path)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
@@ -1,14 +1,36 @@
 import sqlite3
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from ..util.registry import ToolRegistry
 from .connection import get_db_connection
 from ..models.db_models import TableDataInput, TableNameInput, QueryInput
-from ..util.sql_helpers import convert_value_for_sql
+from ..util.sql_helpers import sanitize_column_name, sanitize_row_keys
 from ..config import MAX_QUERY_ROWS
-from .schema import create_table_from_data
+from .schema import create_table_from_data, get_table_columns, insert_rows
 from ..util.logger import log_data_validation_warning, log_sql_debug
 
+# Fixed or parameterized SQL, so sqlite3's per-connection statement cache can
+# reuse the compiled statement across calls (and across table names).
+_LIST_TABLES_SQL = "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+_TABLE_EXISTS_SQL = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+_TABLE_INFO_SQL = 'SELECT name, type, "notnull", pk FROM pragma_table_info(?)'
+
+# PRAGMAs whose argument only selects what to report. For any other PRAGMA an
+# argument sets a connection setting, which would outlive the query on the
+# pooled connection.
+_PRAGMAS_READ_WITH_ARGUMENT = frozenset({
+    "table_info", "table_xinfo", "table_list", "index_list", "index_info", "index_xinfo",
+    "foreign_key_list", "foreign_key_check", "integrity_check", "quick_check",
+})
+
+
+def _deny_pragma_writes(action: int, arg1: Optional[str], arg2: Optional[str], *_: Any) -> int:
+    """sqlite3 authorizer for query_database: PRAGMAs may read but not set values."""
+    if action == sqlite3.SQLITE_PRAGMA and arg2 is not None and arg1.lower() not in _PRAGMAS_READ_WITH_ARGUMENT:
+        return sqlite3.SQLITE_DENY
+    return sqlite3.SQLITE_OK
+
+
 def register_db_tools(registry: ToolRegistry):
     """Register database tools with the MCP server."""
 
@@ -53,69 +75,43 @@ def register_db_tools(registry: ToolRegistry):
                 cursor = conn.cursor()
 
                 # Get actual column names from the table schema
-                cursor.execute(f'PRAGMA table_info("{table_name}")')
-                schema_info = cursor.fetchall()
-                if not schema_info:
+                table_columns = get_table_columns(cursor, table_name)
+                if not table_columns:
                     return {"error": f"Could not retrieve schema for table '{table_name}'. Does it exist?"}
-                table_columns = [row['name'] for row in schema_info]
-                table_columns_set = set(table_columns)
 
-                # Prepare data for executemany, matching dict keys to table columns
+                # Prepare data for insert_rows, matching dict keys to table columns.
+                # The key -> column mapping depends only on a row's keys, so it is
+                # computed once per distinct key tuple rather than once per row.
                 rows_to_insert = []
                 skipped_keys = set()
                 processed_count = 0
+                source_keys_by_row_keys: Dict[Tuple[str, ...], List[Optional[str]]] = {}
                 for item_dict in data:
-                    row_tuple = []
-                    valid_row = True
-                    # Sanitize keys from the input dictionary *before* matching
-                    sanitized_item_dict = {}
-                    original_keys_map = {} # Map sanitized back to original if needed later
-                    processed_keys_in_row = set()
-                    for key, value in item_dict.items():
-                        safe_key = ''.join(c if c.isalnum() or c == '_' else '_' for c in key)
-                        if not safe_key or safe_key[0].isdigit() or not safe_key.isidentifier():
-                            if key not in skipped_keys:
-                                 log_data_validation_warning(f"Skipping invalid key '{key}' from input data during insert.")
-                                 skipped_keys.add(key)
-                            continue
-                        # Handle duplicate sanitized keys from the *same input dict* if necessary
-                        temp_key = safe_key
-                        counter = 1
-                        while temp_key in processed_keys_in_row:
-                            temp_key = f"{safe_key}_{counter}"
-                            counter += 1
-                        safe_key = temp_key
-                        processed_keys_in_row.add(safe_key)
-
-                        sanitized_item_dict[safe_key] = value
-                        original_keys_map[safe_key] = key
-
-
-                    # Build the tuple based on table_columns order
-                    for col_name in table_columns:
-                        if col_name in sanitized_item_dict:
-                            value = sanitized_item_dict[col_name]
-                            # Convert complex types to JSON strings if needed
-                            row_tuple.append(convert_value_for_sql(value))
-                        else:
-                            # Key from table schema not found in (sanitized) input dict
-                            row_tuple.append(None) # Insert NULL for missing columns
-
-                    if valid_row:
-                        rows_to_insert.append(tuple(row_tuple))
-                        processed_count += 1
+                    row_keys = tuple(item_dict)
+                    source_keys = source_keys_by_row_keys.get(row_keys)
+                    if source_keys is None:
+                        for key in row_keys:
+                            if not sanitize_column_name(key)[1] and key not in skipped_keys:
+                                log_data_validation_warning(f"Skipping invalid key '{key}' from input data during insert.")
+                                skipped_keys.add(key)
+                        column_to_key = sanitize_row_keys(row_keys)
+                        # None for table columns this row lacks; item_dict.get(None) -> NULL
+                        source_keys = [column_to_key.get(col) for col in table_columns]
+                        source_keys_by_row_keys[row_keys] = source_keys
+
+                    # list/dict values are JSON-encoded by the adapters registered in connection.py
+                    rows_to_insert.append(tuple(map(item_dict.get, source_keys)))
+                    processed_count += 1
 
                 if not rows_to_insert:
                      return {"error": f"No data could be prepared for insertion into '{table_name}' (check data format and table schema match after key sanitization). Processed {processed_count}/{len(data)} input items."}
 
-                placeholders = ", ".join(["?"] * len(table_columns))
-                quoted_columns = ", ".join([f'"{col}"' for col in table_columns])
-                insert_sql = f'INSERT INTO "{table_name}" ({quoted_columns}) VALUES ({placeholders})'
-
                 log_sql_debug(f"Executing INSERT for {len(rows_to_insert)} rows into {table_name}...")
-                cursor.executemany(insert_sql, rows_to_insert)
+                # Take the write lock up front rather than upgrading mid-insert
+                cursor.execute("BEGIN IMMEDIATE")
+                rows_inserted = insert_rows(cursor, table_name, tuple(table_columns), rows_to_insert)
                 conn.commit()
-                return {"success": f"Inserted {cursor.rowcount} rows into '{table_name}'. Processed {processed_count}/{len(data)} input items."}
+                return {"success": f"Inserted {rows_inserted} rows into '{table_name}'. Processed {processed_count}/{len(data)} input items."}
 
         except sqlite3.Error as e:
             # Provide more specific error info if possible
@@ -143,9 +139,8 @@ def register_db_tools(registry: ToolRegistry):
             with get_db_connection() as conn:
                 cursor = conn.cursor()
                 # Select names of tables, excluding sqlite system tables
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-                # Fetch all results as dictionaries (due to row_factory)
-                tables = [row['name'] for row in cursor.fetchall()]
+                cursor.execute(_LIST_TABLES_SQL)
+                tables = [row[0] for row in cursor.fetchall()]
                 return {"tables": tables}
         except sqlite3.Error as e:
             return {"error": f"SQLite error listing tables: {e}"}
@@ -169,15 +164,15 @@ def register_db_tools(registry: ToolRegistry):
              return {"error": f"Invalid table name: '{table_name}'. Use alphanumeric characters and underscores."}
 
         try:
-            with get_db_connection() as conn:
+            with get_db_connection(row_factory=sqlite3.Row) as conn:
                 cursor = conn.cursor()
-                # Use PRAGMA for schema info, quoting the table name for safety
-                cursor.execute(f'PRAGMA table_info("{table_name}")')
+                # table_info as a table-valued function, with the name bound as a parameter
+                cursor.execute(_TABLE_INFO_SQL, (table_name,))
                 schema_rows = cursor.fetchall()
                 # Check if the table exists / has columns
                 if not schema_rows:
                      # Verify the table actually exists before saying no columns
-                     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+                     cursor.execute(_TABLE_EXISTS_SQL, (table_name,))
                      if cursor.fetchone():
                           return {"schema": [], "message": f"Table '{table_name}' exists but has no columns defined (or PRAGMA failed)."}
                      else:
@@ -213,10 +208,7 @@ def register_db_tools(registry: ToolRegistry):
             with get_db_connection() as conn:
                 cursor = conn.cursor()
                 # Verify the table exists before dropping
-                cursor.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                    (table_name,),
-                )
+                cursor.execute(_TABLE_EXISTS_SQL, (table_name,))
                 if not cursor.fetchone():
                     return {"error": f"Table '{table_name}' not found."}
 
@@ -245,10 +237,11 @@ def register_db_tools(registry: ToolRegistry):
         IMPORTANT: In your final response to the user, you MUST cite the source of your data (e.g., "Query results from table 'my_analysis'").
         """
         query = query_input.sql_query.strip()
-        normalized = query.lower()
-        if not normalized.startswith("select") and not normalized.startswith("pragma"):
+        # Only the keyword is lowercased, not the whole (possibly long) query
+        if query[:6].lower() not in ("select", "pragma"):
             return {"error": "Only SELECT or PRAGMA queries are allowed for safety."}
-        if ';' in query[:-1]:
+        semicolon = query.find(';')
+        if semicolon != -1 and semicolon != len(query) - 1:
             return {"error": "Multiple SQL statements are not allowed in a single query."}
 
         try:
@@ -256,23 +249,36 @@ def register_db_tools(registry: ToolRegistry):
                 # Engine-level read-only enforcement — rejects any write operation
                 # regardless of how the query string is crafted.
                 conn.execute("PRAGMA query_only = ON")
-                cursor = conn.cursor()
-                log_sql_debug(f"Executing query: {query}")
-                cursor.execute(query)
-                results = cursor.fetchall() # Fetch all rows based on conn.row_factory
-
-                # Determine columns even if there are no results for SELECT/PRAGMA
-                columns = []
-                if cursor.description:
-                    columns = [description[0] for description in cursor.description]
-
-                # Convert Row objects to simple dictionaries for the output
-                rows = [dict(row) for row in results]
+                # query_only still allows PRAGMA assignments, so deny those at prepare time
+                conn.set_authorizer(_deny_pragma_writes)
+                try:
+                    # Plain tuples (the default): rows are zipped into dicts below
+                    cursor = conn.cursor()
+                    log_sql_debug(f"Executing query: {query}")
+                    cursor.execute(query)
+                    # SQLite steps rows lazily, so fetching one past the cap is
+                    # enough to detect truncation without reading the rest
+                    results = cursor.fetchmany(MAX_QUERY_ROWS + 1)
+
+                    # Determine columns even if there are no results for SELECT/PRAGMA
+                    columns = []
+                    if cursor.description:
+                        columns = [description[0] for description in cursor.description]
+                    # Reset the (possibly unfinished) statement so the pooled
+                    # connection doesn't keep holding a read snapshot
+                    cursor.close()
+                finally:
+                    # The connection is pooled — don't leave it read-only for the next tool
+                    conn.set_authorizer(None)
+                    conn.execute("PRAGMA query_only = OFF")
+
+                # Convert row tuples to simple dictionaries for the output
+                rows = [dict(zip(columns, row)) for row in results]
 
                 # Limit the number of rows returned to prevent exceeding limits
                 message = None
                 if len(rows) > MAX_QUERY_ROWS:
-                    log_data_validation_warning(f"Query returned {len(rows)} rows. Truncating to {MAX_QUERY_ROWS}.")
+                    log_data_validation_warning(f"Query returned more than {MAX_QUERY_ROWS} rows. Truncating.")
                     rows = rows[:MAX_QUERY_ROWS]
                     message = f"Result truncated to the first {MAX_QUERY_ROWS} rows."
 
@@ -288,6 +294,8 @@ def register_db_tools(registry: ToolRegistry):
                 error_msg += ". Use list_tables() to see available tables."
             elif "no such column" in str(e):
                 error_msg += ". Use get_table_schema() to see available columns for the table."
+            elif "not authorized" in str(e):
+                error_msg += ". PRAGMA queries can read settings but not change them."
             return {"error": error_msg}
         except Exception as e:
             return {"error": f"Unexpected error executing query: {e}"}
@@ -1,23 +1,79 @@
 import sqlite3
 import json
-from typing import List, Dict, Any
+from itertools import chain, islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from .. import config
 from .connection import get_db_connection
-from ..util.sql_helpers import infer_sql_type, convert_value_for_sql
-from ..models.db_models import TableDataInput
+from ..util.sql_helpers import build_insert_sql, infer_sql_type, sanitize_column_name, sanitize_row_keys
+from ..models.db_models import CreateTableInput
 from ..util.logger import log_data_validation_warning, log_sql_debug
 
-def create_table_from_data(table_input: TableDataInput) -> Dict[str, Any]:
+# Reference-period columns (lowercased) that get an index — they are the usual
+# WHERE/ORDER BY target when querying stored StatCan series.
+_INDEXED_DATE_COLUMNS = {"refper", "ref_date", "date"}
+
+# (db path, table name) -> (schema_version, column names). schema_version is
+# bumped by SQLite on any schema change from any connection or process, so a
+# matching version means the cached columns are still accurate.
+_TABLE_COLUMNS_CACHE: Dict[Tuple[str, str], Tuple[int, List[str]]] = {}
+
+# Bound parameters per multi-row INSERT; 999 is SQLite's limit before 3.32
+_MAX_SQL_VARIABLES = 999
+
+
+def get_table_columns(cursor: sqlite3.Cursor, table_name: str) -> List[str]:
+    """Returns the column names of table_name, or [] if it does not exist.
+
+    Reading the schema_version cookie is much cheaper than PRAGMA table_info,
+    so repeated inserts into the same table skip the full schema lookup.
+    """
+    key = (config.DB_FILE, table_name)
+    version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+    cached = _TABLE_COLUMNS_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    columns = [row[0] for row in cursor.execute("SELECT name FROM pragma_table_info(?)", (table_name,))]
+    if columns:
+        _TABLE_COLUMNS_CACHE[key] = (version, columns)
+    return columns
+
+def insert_rows(cursor: sqlite3.Cursor, table_name: str, columns: Tuple[str, ...], rows: Iterable[Tuple[Any, ...]]) -> int:
+    """Inserts rows (tuples aligned to columns) and returns the number inserted.
+
+    Rows go in as multi-row INSERT ... VALUES (...), (...) statements of as many
+    rows as fit in _MAX_SQL_VARIABLES, so SQLite steps once per batch instead
+    of once per row. rows is consumed lazily, one batch at a time.
+    """
+    batch_size = max(1, _MAX_SQL_VARIABLES // len(columns))
+    rows = iter(rows)
+    inserted = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return inserted
+        cursor.execute(build_insert_sql(table_name, columns, len(batch)), list(chain.from_iterable(batch)))
+        inserted += cursor.rowcount
+
+def create_table_from_data(table_input: CreateTableInput) -> Dict[str, Any]:
     """
     Creates a new SQLite table from the provided data AND immediately inserts all rows.
-    Infers column names and types from the first item in the data list.
+    Infers column names from the first item in the data list, and each column's
+    type from its first non-null value.
     WARNING: Overwrites the table if it already exists.
 
     Use this as a single step to store fetched API data — no need to call
     insert_data_into_table afterwards. Use insert_data_into_table only to
     append more rows to an already-existing table.
 
+    Reference-period columns (refPer, REF_DATE, date) are indexed automatically.
+    Pass primary_key to declare a column that is unique per row; the table is
+    then stored clustered on that key (WITHOUT ROWID). Rows missing the key or
+    with a null value for it are rejected up front, and duplicate values fail
+    the whole call.
+
     Args:
-        table_input: Object containing table_name and data (list of dicts).
+        table_input: Object containing table_name, data (list of dicts) and
+            optionally primary_key.
 
     Returns:
         Dict[str, Any]: A summary with table name, columns created, and rows inserted.
@@ -35,80 +91,112 @@ def create_table_from_data(table_input: TableDataInput) -> Dict[str, Any]:
     if not table_name.isidentifier():
         return {"error": f"Invalid table name: '{table_name}'. Use alphanumeric characters and underscores, and cannot be a keyword."}
 
-    # Infer columns and types from the first data item
-    columns_def = []
-    valid_column_names = []  # Ordered list of sanitized column names
-    seen_names = set()
+    # Infer columns from the first data item: sanitized name -> original key,
+    # insertion-ordered so it doubles as the ordered set of column names
     first_item = data[0]
-    for col_name, value in first_item.items():
-        safe_col_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in col_name)
-        if not safe_col_name or safe_col_name[0].isdigit() or not safe_col_name.isidentifier():
-            log_data_validation_warning(f"Skipping column with potentially invalid original name: '{col_name}' -> '{safe_col_name}'")
-            continue
-        # Deduplicate after sanitization
-        temp_name = safe_col_name
-        counter = 1
-        while temp_name in seen_names:
-            temp_name = f"{safe_col_name}_{counter}"
-            counter += 1
-        safe_col_name = temp_name
-        seen_names.add(safe_col_name)
-
-        sql_type = infer_sql_type(value)
-        columns_def.append(f'"{safe_col_name}" {sql_type}')
-        valid_column_names.append(safe_col_name)
-
-    if not columns_def:
+    column_to_key = sanitize_row_keys(first_item)
+    if len(column_to_key) < len(first_item):
+        for col_name in first_item:
+            safe_col_name, is_valid = sanitize_column_name(col_name)
+            if not is_valid:
+                log_data_validation_warning(f"Skipping column with potentially invalid original name: '{col_name}' -> '{safe_col_name}'")
+    if not column_to_key:
         return {"error": "No valid columns found in the first data item after validation."}
 
-    create_sql = f'CREATE TABLE "{table_name}" ({", ".join(columns_def)})'
-    drop_sql = f'DROP TABLE IF EXISTS "{table_name}"'
+    valid_column_names = list(column_to_key)
+    sample_values = _first_non_null_values(data)
+    columns_def = [
+        f'"{col}" {infer_sql_type(sample_values[key])}' for col, key in column_to_key.items()
+    ]
 
-    # Build insert placeholders based on the columns we defined
-    placeholders = ", ".join(["?"] * len(valid_column_names))
-    quoted_columns = ", ".join([f'"{c}"' for c in valid_column_names])
-    insert_sql = f'INSERT INTO "{table_name}" ({quoted_columns}) VALUES ({placeholders})'
+    primary_key = table_input.primary_key
+    if primary_key and primary_key not in valid_column_names:
+        primary_key, _ = sanitize_column_name(primary_key)
+        if primary_key not in valid_column_names:
+            return {"error": f"primary_key '{table_input.primary_key}' is not one of the columns: {valid_column_names}"}
 
-    # Pre-process all rows: sanitize keys and align to column order
-    rows_to_insert = []
-    for item in data:
-        sanitized = {}
-        seen_in_row: set = set()
-        for key, val in item.items():
-            skey = ''.join(c if c.isalnum() or c == '_' else '_' for c in key)
-            if not skey or skey[0].isdigit() or not skey.isidentifier():
-                continue
-            t = skey
-            n = 1
-            while t in seen_in_row:
-                t = f"{skey}_{n}"
-                n += 1
-            skey = t
-            seen_in_row.add(skey)
-            sanitized[skey] = val
-
-        row_tuple = tuple(
-            convert_value_for_sql(sanitized.get(col)) for col in valid_column_names
+    if primary_key:
+        # WITHOUT ROWID tables enforce NOT NULL on the key; report it clearly up front
+        key_field = column_to_key[primary_key]
+        null_keys = sum(1 for item in data if item.get(key_field) is None)
+        if null_keys:
+            return {"error": f"primary_key '{table_input.primary_key}' is missing or null in {null_keys} of {len(data)} rows."}
+        create_sql = (
+            f'CREATE TABLE "{table_name}" ({", ".join(columns_def)}, PRIMARY KEY ("{primary_key}")) '
+            "WITHOUT ROWID"
         )
-        rows_to_insert.append(row_tuple)
+    else:
+        create_sql = f'CREATE TABLE "{table_name}" ({", ".join(columns_def)})'
+    drop_sql = f'DROP TABLE IF EXISTS "{table_name}"'
+    # "." can't appear in a table or sanitized column name, so "t"/"ref_date"
+    # and "t_ref"/"date" get distinct index names
+    index_sqls = [
+        f'CREATE INDEX "idx_{table_name}.{col}" ON "{table_name}" ("{col}")'
+        for col in valid_column_names
+        if col.lower() in _INDEXED_DATE_COLUMNS and col != primary_key
+    ]
 
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            # One write transaction for drop + create + insert: a single commit,
+            # and a failed insert no longer leaves the old table dropped.
+            cursor.execute("BEGIN IMMEDIATE")
             log_sql_debug(f"Executing: {drop_sql}")
             cursor.execute(drop_sql)
             log_sql_debug(f"Executing: {create_sql}")
             cursor.execute(create_sql)
-            log_sql_debug(f"Inserting {len(rows_to_insert)} rows into '{table_name}'...")
-            cursor.executemany(insert_sql, rows_to_insert)
+            log_sql_debug(f"Inserting {len(data)} rows into '{table_name}'...")
+            # Rows are produced lazily so only one batch of converted tuples exists at a time
+            rows_inserted = insert_rows(cursor, table_name, tuple(valid_column_names), _iter_rows(data, valid_column_names))
+            # Indexes are built after the bulk load — cheaper than maintaining them per row
+            for index_sql in index_sqls:
+                log_sql_debug(f"Executing: {index_sql}")
+                cursor.execute(index_sql)
+            schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
             conn.commit()
+        # The schema is known here, so a following insert_data_into_table needn't look it up
+        _TABLE_COLUMNS_CACHE[(config.DB_FILE, table_name)] = (schema_version, valid_column_names)
         return {
-            "success": f"Table '{table_name}' created with {len(valid_column_names)} columns and {len(rows_to_insert)} rows inserted.",
+            "success": f"Table '{table_name}' created with {len(valid_column_names)} columns and {rows_inserted} rows inserted.",
             "table": table_name,
             "columns": valid_column_names,
-            "rows_inserted": len(rows_to_insert),
+            "rows_inserted": rows_inserted,
         }
     except sqlite3.Error as e:
         return {"error": f"SQLite error creating table '{table_name}': {e}"}
     except Exception as e:
         return {"error": f"Unexpected error creating table '{table_name}': {e}"}
+
+
+def _first_non_null_values(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Returns the first item's values, with None replaced by the column's first non-None value.
+
+    Only columns that are None in the first item are looked up further down, and
+    the scan stops as soon as all of them are resolved.
+    """
+    values = dict(data[0])
+    pending = {key for key, value in values.items() if value is None}
+    for item in islice(data, 1, None):
+        if not pending:
+            break
+        for key in [key for key in pending if item.get(key) is not None]:
+            values[key] = item[key]
+            pending.discard(key)
+    return values
+
+
+def _iter_rows(data: List[Dict[str, Any]], columns: List[str]) -> Iterator[Tuple[Any, ...]]:
+    """Yields each item as a tuple aligned to columns, sanitizing keys the same way as the schema."""
+    # Rows almost always share the same keys, so resolve each key tuple once
+    source_keys_by_row_keys: Dict[Tuple[str, ...], List[Optional[str]]] = {}
+    for item in data:
+        row_keys = tuple(item)
+        source_keys = source_keys_by_row_keys.get(row_keys)
+        if source_keys is None:
+            column_to_key = sanitize_row_keys(row_keys)
+            # None for columns this row lacks; item.get(None) -> NULL
+            source_keys = [column_to_key.get(col) for col in columns]
+            source_keys_by_row_keys[row_keys] = source_keys
+        # list/dict values are JSON-encoded by the adapters registered in connection.py
+        yield tuple(map(item.get, source_keys))
@@ -1,10 +1,18 @@
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class TableDataInput(BaseModel):
     table_name: str = Field(..., description="Name for the SQL table (alphanumeric and underscores recommended).")
     data: List[Dict[str, Any]] = Field(..., description="Data to insert, as a list of dictionaries.")
 
+class CreateTableInput(TableDataInput):
+    primary_key: Optional[str] = Field(
+        None,
+        description="Optional column whose values are unique and non-null in every row (e.g. "
+                    "'vectorId' for one row per series). The table is then stored clustered on "
+                    "it (WITHOUT ROWID) for faster lookups.",
+    )
+
 class TableNameInput(BaseModel):
     table_name: str = Field(..., description="Name of the SQL table.")
 
@@ -145,7 +145,10 @@ def create_server(http_mode: bool = False):
             # Format result to MCP Content list
             if isinstance(result, list) or isinstance(result, dict):
                 import json
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                # Compact, non-ASCII-escaped JSON: the reader is the model, and
+                # indentation/\u escapes only spend context tokens
+                text = json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+                return [TextContent(type="text", text=text)]
             elif result is None:
                 return [TextContent(type="text", text="Tool executed successfully with no output.")]
             else:
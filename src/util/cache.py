@@ -1,14 +1,22 @@
 # Cube cache module for StatCan MCP Server
 # Caches the cube list to avoid repeated API calls
 
+import asyncio
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from ..util.logger import log_server_debug
 
 # Global cache storage
 _CUBE_CACHE: Optional[List[Dict[str, Any]]] = None
-_CACHE_TIMESTAMP: Optional[float] = None
+_CACHE_TIMESTAMP: Optional[float] = None  # time.monotonic() of last fetch
 _CACHE_TTL_SECONDS: float = 3600.0  # 1 hour cache TTL
+# Shared task for a fetch already in progress — concurrent cache misses
+# await it instead of each downloading the (multi-MB) cube list.
+_INFLIGHT_FETCH: Optional[asyncio.Task] = None
+# (cube, lowercased EN title, lowercased FR title), built once per cube list
+# so title searches don't re-lowercase ~8k titles on every call.
+_TITLE_INDEX: Optional[List[Tuple[Dict[str, Any], str, str]]] = None
+_TITLE_INDEX_SOURCE: Optional[List[Dict[str, Any]]] = None
 
 async def get_cached_cubes_list_lite(fetch_func) -> List[Dict[str, Any]]:
     """
@@ -20,9 +28,9 @@ async def get_cached_cubes_list_lite(fetch_func) -> List[Dict[str, Any]]:
     Returns:
         List of cube dictionaries in lite format
     """
-    global _CUBE_CACHE, _CACHE_TIMESTAMP
+    global _CUBE_CACHE, _CACHE_TIMESTAMP, _INFLIGHT_FETCH
     
-    current_time = time.time()
+    current_time = time.monotonic()
     
     # Check if cache is valid
     if _CUBE_CACHE is not None and _CACHE_TIMESTAMP is not None:
@@ -33,21 +41,66 @@ async def get_cached_cubes_list_lite(fetch_func) -> List[Dict[str, Any]]:
         else:
             log_server_debug(f"Cache expired (age: {cache_age:.1f}s > TTL: {_CACHE_TTL_SECONDS}s)")
     
-    # Fetch fresh data
-    log_server_debug("Fetching fresh cube list from API...")
-    start_time = time.time()
-    _CUBE_CACHE = await fetch_func()
-    _CACHE_TIMESTAMP = time.time()
-    elapsed = _CACHE_TIMESTAMP - start_time
-    log_server_debug(f"Cached {len(_CUBE_CACHE)} cubes in {elapsed:.2f}s")
-    
-    return _CUBE_CACHE
+    if _INFLIGHT_FETCH is None:
+        log_server_debug("Fetching fresh cube list from API...")
+        # A task of its own, not tied to this caller: if the caller that
+        # started the fetch is cancelled, the others still get the result.
+        _INFLIGHT_FETCH = asyncio.ensure_future(_fetch_and_cache(fetch_func))
+        # Nobody may be left to await a failure; retrieve it so it isn't logged as unhandled
+        _INFLIGHT_FETCH.add_done_callback(lambda task: task.cancelled() or task.exception())
+    else:
+        log_server_debug("Awaiting in-flight cube list fetch...")
+    # shield() so cancelling one caller doesn't cancel the shared fetch
+    return await asyncio.shield(_INFLIGHT_FETCH)
+
+async def _fetch_and_cache(fetch_func) -> List[Dict[str, Any]]:
+    """Fetches the cube list into the cache; run as the shared in-flight task."""
+    global _CUBE_CACHE, _CACHE_TIMESTAMP, _INFLIGHT_FETCH
+
+    try:
+        start_time = time.monotonic()
+        cubes = await fetch_func()
+        _CUBE_CACHE = cubes
+        _CACHE_TIMESTAMP = time.monotonic()
+    finally:
+        _INFLIGHT_FETCH = None
+    log_server_debug(f"Cached {len(cubes)} cubes in {_CACHE_TIMESTAMP - start_time:.2f}s")
+    return cubes
+
+async def get_cached_cube_title_index(fetch_func) -> List[Tuple[Dict[str, Any], str, str]]:
+    """
+    Returns (cube, title_en_lower, title_fr_lower) for every cached cube.
+
+    The index is rebuilt only when the underlying cube list is refetched.
+
+    Args:
+        fetch_func: Async function to fetch cube list when cache is stale
+
+    Returns:
+        List of (cube, lowercased English title, lowercased French title) tuples
+    """
+    global _TITLE_INDEX, _TITLE_INDEX_SOURCE
+
+    cubes = await get_cached_cubes_list_lite(fetch_func)
+    if _TITLE_INDEX is None or _TITLE_INDEX_SOURCE is not cubes:
+        _TITLE_INDEX = [
+            (
+                cube,
+                (cube.get("cubeTitleEn", "") or "").lower(),
+                (cube.get("cubeTitleFr", "") or "").lower(),
+            )
+            for cube in cubes
+        ]
+        _TITLE_INDEX_SOURCE = cubes
+    return _TITLE_INDEX
 
 def invalidate_cache():
     """Manually invalidate the cube cache."""
-    global _CUBE_CACHE, _CACHE_TIMESTAMP
+    global _CUBE_CACHE, _CACHE_TIMESTAMP, _TITLE_INDEX, _TITLE_INDEX_SOURCE
     _CUBE_CACHE = None
     _CACHE_TIMESTAMP = None
+    _TITLE_INDEX = None
+    _TITLE_INDEX_SOURCE = None
     log_server_debug("Cube cache invalidated")
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -57,7 +110,7 @@ def get_cache_stats() -> Dict[str, Any]:
     if _CUBE_CACHE is None:
         return {"cached": False, "count": 0, "age_seconds": None}
     
-    age = time.time() - _CACHE_TIMESTAMP if _CACHE_TIMESTAMP else None
+    age = time.monotonic() - _CACHE_TIMESTAMP if _CACHE_TIMESTAMP else None
     return {
         "cached": True,
         "count": len(_CUBE_CACHE),
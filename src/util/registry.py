@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import json
 from typing import Any, Callable, Dict, List, Optional, Union, get_type_hints
@@ -110,13 +111,14 @@ class ToolRegistry:
             if inspect.iscoroutinefunction(handler):
                 return await handler(model_inst)
             else:
-                return handler(model_inst)
+                # Sync handlers (the SQLite tools) block, so keep them off the event loop
+                return await asyncio.to_thread(handler, model_inst)
 
         # Standard Argument Unpacking
         if inspect.iscoroutinefunction(handler):
             return await handler(**arguments)
         else:
-            return handler(**arguments)
+            return await asyncio.to_thread(handler, **arguments)
 
 # Global Registry Instance
 registry = ToolRegistry()
@@ -1,5 +1,52 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Tuple
 import json
+import re
+
+# \W is the complement of str.isalnum() plus '_', matching the old per-char rule
+_NON_WORD_RE = re.compile(r"\W")
+
+@lru_cache(maxsize=4096)
+def sanitize_column_name(key: str) -> Tuple[str, bool]:
+    """Replaces non-word characters with '_' for use as a column name.
+
+    Returns (sanitized_name, is_valid). Row dicts share keys, so results are
+    memoized and each distinct key is only sanitized once.
+    """
+    safe_key = _NON_WORD_RE.sub("_", key)
+    return safe_key, bool(safe_key) and not safe_key[0].isdigit() and safe_key.isidentifier()
+
+def sanitize_row_keys(keys: Iterable[str]) -> Dict[str, str]:
+    """Maps sanitized column name -> original key for one row's keys.
+
+    Invalid keys are dropped; keys that sanitize to the same name get _1, _2...
+    suffixes in order. Rows sharing the same keys (the common case) map
+    identically, so callers can compute this once per distinct key tuple.
+    """
+    mapping: Dict[str, str] = {}
+    for key in keys:
+        safe_key, is_valid = sanitize_column_name(key)
+        if not is_valid:
+            continue
+        temp_key = safe_key
+        counter = 1
+        while temp_key in mapping:
+            temp_key = f"{safe_key}_{counter}"
+            counter += 1
+        mapping[temp_key] = key
+    return mapping
+
+@lru_cache(maxsize=256)
+def build_insert_sql(table_name: str, columns: Tuple[str, ...], row_count: int = 1) -> str:
+    """Returns the parameterized INSERT of row_count rows for columns of table_name.
+
+    Memoized per (table, columns, row_count): repeated inserts into the same table
+    reuse the string (and so sqlite3's cached prepared statement) without rebuilding it.
+    """
+    placeholders = ", ".join(["?"] * len(columns))
+    quoted_columns = ", ".join([f'"{col}"' for col in columns])
+    values = ", ".join([f"({placeholders})"] * row_count)
+    return f'INSERT INTO "{table_name}" ({quoted_columns}) VALUES {values}'
 
 def infer_sql_type(value: Any) -> str:
     """Infers a basic SQLite data type from a Python value."""
@@ -14,7 +61,10 @@ def infer_sql_type(value: Any) -> str:
         return "TEXT"
 
 def convert_value_for_sql(value: Any) -> Any:
-    """Convert Python values to SQL-compatible values."""
+    """Convert Python values to SQL-compatible values.
+
+    Registered as the sqlite3 adapter for list and dict in db/connection.py.
+    """
     if isinstance(value, (list, dict)):
         try:
             return json.dumps(value)
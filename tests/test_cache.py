@@ -0,0 +1,95 @@
+"""Tests for the cube-list cache in src/util/cache.py."""
+
+import asyncio
+
+import pytest
+
+from src.util import cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    cache.invalidate_cache()
+    yield
+    cache.invalidate_cache()
+
+
+def test_concurrent_misses_share_one_fetch():
+    """Cache misses that overlap an in-flight fetch await it instead of refetching."""
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"productId": 1}]
+
+    async def run():
+        return await asyncio.gather(*[cache.get_cached_cubes_list_lite(fetch) for _ in range(5)])
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert all(r == [{"productId": 1}] for r in results)
+
+
+def test_failed_fetch_propagates_to_all_waiters_and_is_not_cached():
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("api down")
+
+    async def run():
+        return await asyncio.gather(
+            *[cache.get_cached_cubes_list_lite(fetch) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get_cache_stats()["cached"] is False
+
+
+def test_title_index_is_built_once_per_cube_list():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return [{"productId": 1, "cubeTitleEn": "Labour FORCE", "cubeTitleFr": None}]
+
+    async def run():
+        first = await cache.get_cached_cube_title_index(fetch)
+        second = await cache.get_cached_cube_title_index(fetch)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert first == [({"productId": 1, "cubeTitleEn": "Labour FORCE", "cubeTitleFr": None}, "labour force", "")]
+    assert calls == 1
+
+    cache.invalidate_cache()
+    rebuilt, _ = asyncio.run(run())
+    assert rebuilt is not first
+    assert calls == 2
+
+
+def test_cancelling_first_caller_does_not_cancel_other_waiters():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"productId": 1}]
+
+    async def run():
+        first = asyncio.ensure_future(cache.get_cached_cubes_list_lite(fetch))
+        second = asyncio.ensure_future(cache.get_cached_cubes_list_lite(fetch))
+        await asyncio.sleep(0)  # both callers are now awaiting the shared fetch
+        first.cancel()
+        return await second, first
+
+    result, first = asyncio.run(run())
+    assert first.cancelled()
+    assert result == [{"productId": 1}]
+    assert calls == 1
+    assert cache.get_cache_stats()["cached"] is True
@@ -0,0 +1,26 @@
+"""Tests for the CLI output helpers in src/cli/output.py."""
+
+import csv
+import io
+
+from src.cli.output import rows_to_csv
+
+
+def test_rows_to_csv_matches_dictwriter_output():
+    rows = [{"a": 1, "b": None, "c": 'say "hi", ok'}, {"a": 2, "b": 3.5, "c": ""}]
+
+    expected = io.StringIO()
+    writer = csv.DictWriter(expected, fieldnames=rows[0].keys())
+    writer.writeheader()
+    writer.writerows(rows)
+
+    assert rows_to_csv(rows) == expected.getvalue()
+
+
+def test_rows_to_csv_uses_union_of_keys():
+    rows = [{"a": 1}, {"b": 2, "a": 3}]
+    assert rows_to_csv(rows) == "a,b\r\n1,\r\n3,2\r\n"
+
+
+def test_rows_to_csv_empty():
+    assert rows_to_csv([]) == ""
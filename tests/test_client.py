@@ -0,0 +1,110 @@
+"""Tests for the shared HTTP retry helper in src/api/client.py.
+
+Transient failures (connection errors, read timeouts, 5xx) are retried with
+jittered exponential backoff, 429s on a slower schedule or per Retry-After;
+anything else propagates on the first attempt.
+asyncio.sleep is patched out so the suite does not actually wait.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from src.api import client
+from src.api.vector import register_vector_tools
+from src.config import BASE_URL
+from src.models.api_models import VectorIdInput
+from src.util.registry import ToolRegistry
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    delays = []
+
+    async def _fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(client.asyncio, "sleep", _fake_sleep)
+    return delays
+
+
+# ---------------------------------------------------------------------------
+# Retry behaviour
+# ---------------------------------------------------------------------------
+
+@respx.mock
+def test_connect_error_is_retried_then_succeeds(no_sleep):
+    route = respx.get(f"{BASE_URL}/getCodeSets").mock(
+        side_effect=[httpx.ConnectError("boom"), httpx.Response(200, json={"status": "SUCCESS"})]
+    )
+    result = asyncio.run(client.make_get_request("/getCodeSets"))
+    assert result == {"status": "SUCCESS"}
+    assert route.call_count == 2
+    assert len(no_sleep) == 1
+
+
+@respx.mock
+def test_retry_status_is_retried_until_attempts_exhausted(no_sleep):
+    route = respx.post(f"{BASE_URL}/getCubeMetadata").mock(return_value=httpx.Response(503))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.make_post_request("/getCubeMetadata", [{"productId": 1}]))
+    assert route.call_count == client._MAX_RETRY_ATTEMPTS
+    # No sleep after the final attempt
+    assert len(no_sleep) == client._MAX_RETRY_ATTEMPTS - 1
+
+
+@respx.mock
+def test_client_error_is_not_retried(no_sleep):
+    route = respx.get("https://example.test/sdmx").mock(return_value=httpx.Response(404))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.make_sdmx_get("https://example.test/sdmx"))
+    assert route.call_count == 1
+    assert no_sleep == []
+
+
+@respx.mock
+def test_rate_limit_honours_retry_after_then_falls_back_to_slow_schedule(no_sleep):
+    route = respx.get(f"{BASE_URL}/getCodeSets").mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(429),
+            httpx.Response(200, json={"status": "SUCCESS"}),
+        ]
+    )
+    assert asyncio.run(client.make_get_request("/getCodeSets")) == {"status": "SUCCESS"}
+    assert route.call_count == 3
+    # Retry-After first, then the 1s, 2s schedule (attempt 1 -> 2s), not the fast one
+    assert no_sleep == [3.0, 2.0]
+
+
+# ---------------------------------------------------------------------------
+# Tool call sites
+# ---------------------------------------------------------------------------
+
+@respx.mock
+def test_vector_tool_retries_dropped_connection(no_sleep):
+    registry = ToolRegistry()
+    register_vector_tools(registry)
+    route = respx.post(f"{BASE_URL}/getSeriesInfoFromVector").mock(
+        side_effect=[
+            httpx.RemoteProtocolError("connection dropped"),
+            httpx.Response(200, json=[{"status": "SUCCESS", "object": {"vectorId": 32164132}}]),
+        ]
+    )
+    handler = registry._handlers["get_series_info_from_vector"]
+    result = asyncio.run(handler(VectorIdInput(vectorId=32164132)))
+    assert result == {"vectorId": 32164132}
+    assert route.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Backoff schedule
+# ---------------------------------------------------------------------------
+
+def test_backoff_delay_is_jittered_and_capped():
+    for attempt in range(6):
+        base = min(client._BACKOFF_INITIAL * (2 ** attempt), client._BACKOFF_MAX)
+        delay = client._backoff_delay(attempt)
+        assert base <= delay <= 2 * base
@@ -0,0 +1,95 @@
+"""Tests for the composite tools in src/api/composite_tools.py.
+
+The StatCan API is mocked with respx; writes go to a temporary database.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from src import config
+from src.api.composite_tools import StoreCubeMetadataInput, register_composite_tools
+from src.db import connection
+from src.db.queries import register_db_tools
+from src.models.db_models import TableNameInput
+from src.util.registry import ToolRegistry
+
+
+def _metadata_response(pid, member_names):
+    return [{
+        "status": "SUCCESS",
+        "object": {
+            "productId": pid,
+            "cubeTitleEn": "Test cube",
+            "dimension": [{
+                "dimensionNameEn": "Geography",
+                "dimensionNameFr": "Géographie",
+                "member": [
+                    {"memberId": i, "memberNameEn": name, "memberNameFr": name, "vectorId": 100 + i}
+                    for i, name in enumerate(member_names, start=1)
+                ],
+            }],
+        },
+    }]
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_FILE", str(tmp_path / "test.db"))
+    registry = ToolRegistry()
+    register_composite_tools(registry)
+    register_db_tools(registry)
+    yield registry._handlers
+    connection.close_db_connections()
+
+
+def _members(pid):
+    with connection.get_db_connection() as conn:
+        return conn.execute(
+            'SELECT member_name_en, vector_id FROM "_statcan_members" WHERE pid = ? ORDER BY member_id', (pid,)
+        ).fetchall()
+
+
+@respx.mock
+def test_store_cube_metadata_replaces_rows_for_same_pid(tools):
+    route = respx.post(f"{config.BASE_URL}/getCubeMetadata")
+    route.mock(return_value=httpx.Response(200, json=_metadata_response(1, ["Canada", "Ontario"])))
+    asyncio.run(tools["store_cube_metadata"](StoreCubeMetadataInput(productId=1)))
+    route.mock(return_value=httpx.Response(200, json=_metadata_response(2, ["Quebec"])))
+    asyncio.run(tools["store_cube_metadata"](StoreCubeMetadataInput(productId=2)))
+
+    route.mock(return_value=httpx.Response(200, json=_metadata_response(1, ["Canada"])))
+    result = asyncio.run(tools["store_cube_metadata"](StoreCubeMetadataInput(productId=1)))
+
+    assert result["total_members_stored"] == 1
+    assert result["dimensions"] == [{"dim_index": 0, "dim_name_en": "Geography", "member_count": 1}]
+    assert _members(1) == [("Canada", "101")]
+    assert _members(2) == [("Quebec", "101")]
+
+
+@respx.mock
+def test_store_cube_metadata_member_lookup_uses_index(tools):
+    respx.post(f"{config.BASE_URL}/getCubeMetadata").mock(
+        return_value=httpx.Response(200, json=_metadata_response(1, ["Canada"]))
+    )
+    asyncio.run(tools["store_cube_metadata"](StoreCubeMetadataInput(productId=1)))
+
+    with connection.get_db_connection() as conn:
+        plan = conn.execute(
+            'EXPLAIN QUERY PLAN SELECT member_name_en FROM "_statcan_members" WHERE pid = 1 AND dim_index = 0'
+        ).fetchall()
+    assert "idx__statcan_members_pid_dim" in str(plan)
+
+
+@respx.mock
+def test_store_cube_metadata_recreates_dropped_tables(tools):
+    respx.post(f"{config.BASE_URL}/getCubeMetadata").mock(
+        return_value=httpx.Response(200, json=_metadata_response(1, ["Canada"]))
+    )
+    asyncio.run(tools["store_cube_metadata"](StoreCubeMetadataInput(productId=1)))
+    assert "success" in tools["drop_table"](TableNameInput(table_name="_statcan_members"))
+
+    assert "success" in asyncio.run(tools["store_cube_metadata"](StoreCubeMetadataInput(productId=1)))
+    assert _members(1) == [("Canada", "101")]
@@ -0,0 +1,89 @@
+"""Tests for src/db/connection.py."""
+
+import threading
+
+import pytest
+
+from src import config
+from src.db import connection
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    connection.close_db_connections()
+    yield
+    connection.close_db_connections()
+
+
+def test_parent_directory_is_created_on_first_connection(tmp_path, monkeypatch):
+    db_dir = tmp_path / "nested" / "dir"
+    monkeypatch.setattr(config, "DB_FILE", str(db_dir / "test.db"))
+
+    connection.get_db_connection()
+
+    assert db_dir.is_dir()
+    assert str(db_dir) in connection._ENSURED_DIRS
+
+
+def test_connection_uses_wal_and_tuned_pragmas(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_FILE", str(tmp_path / "test.db"))
+
+    conn = connection.get_db_connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+
+def test_connection_is_reused_per_thread_and_per_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_FILE", str(tmp_path / "a.db"))
+    first = connection.get_db_connection()
+    assert connection.get_db_connection() is first
+
+    other_thread = []
+    worker = threading.Thread(target=lambda: other_thread.append(connection.get_db_connection()))
+    worker.start()
+    worker.join()
+    assert other_thread[0] is not first
+
+    # --db-path changes config.DB_FILE at runtime; that must get its own connection
+    monkeypatch.setattr(config, "DB_FILE", str(tmp_path / "b.db"))
+    assert connection.get_db_connection() is not first
+
+
+def test_close_db_connections_resets_the_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_FILE", str(tmp_path / "test.db"))
+    first = connection.get_db_connection()
+
+    connection.close_db_connections()
+
+    second = connection.get_db_connection()
+    assert second is not first
+    assert second.execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_in_memory_database_skips_wal(monkeypatch):
+    monkeypatch.setattr(config, "DB_FILE", ":memory:")
+
+    with connection.get_db_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+    assert ":memory:" not in connection._WAL_ENABLED
+
+
+@pytest.mark.parametrize("db_path", [":memory:", ""])
+def test_private_database_is_shared_across_threads(db_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_FILE", db_path)
+    with connection.get_db_connection() as conn:
+        conn.execute("CREATE TABLE t (a)")
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    # Each to_thread worker must see the same database, not a fresh empty one
+    seen = []
+
+    def read():
+        with connection.get_db_connection() as conn:
+            seen.append(conn.execute("SELECT a FROM t").fetchall())
+
+    worker = threading.Thread(target=read)
+    worker.start()
+    worker.join()
+    assert seen == [[(1,)]]
@@ -0,0 +1,153 @@
+"""Tests for the SQLite tools in src/db/queries.py and src/db/schema.py.
+
+Handlers are called directly (synchronously) against a temporary database.
+"""
+
+import pytest
+
+from src import config
+from src.db import connection
+from src.db.queries import register_db_tools
+from src.models.db_models import CreateTableInput, QueryInput, TableDataInput, TableNameInput
+from src.util.registry import ToolRegistry
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_FILE", str(tmp_path / "test.db"))
+    registry = ToolRegistry()
+    register_db_tools(registry)
+    yield registry._handlers
+    connection.close_db_connections()
+
+
+def test_query_database_does_not_leave_pooled_connection_read_only(tools):
+    tools["create_table_from_data"](CreateTableInput(table_name="t", data=[{"a": 1}]))
+
+    assert "error" in tools["query_database"](QueryInput(sql_query="SELECT * FROM missing"))
+
+    result = tools["insert_data_into_table"](TableDataInput(table_name="t", data=[{"a": 2}]))
+    assert "success" in result
+    rows = tools["query_database"](QueryInput(sql_query="SELECT a FROM t ORDER BY a"))["rows"]
+    assert rows == [{"a": 1}, {"a": 2}]
+
+
+def test_query_database_rejects_pragma_assignments(tools):
+    for query in ("PRAGMA cache_size = 10", 'PRAGMA "cache_size"(10)', "PRAGMA/**/foreign_keys=ON"):
+        result = tools["query_database"](QueryInput(sql_query=query))
+        assert "PRAGMA queries can read settings" in result["error"]
+
+    # Reads, including the introspection PRAGMAs that take an argument, still work
+    tools["create_table_from_data"](CreateTableInput(table_name="t", data=[{"a": 1}]))
+    rows = tools["query_database"](QueryInput(sql_query="PRAGMA cache_size"))["rows"]
+    assert rows == [{"cache_size": -65536}]  # the pooled connection's own setting
+    assert tools["query_database"](QueryInput(sql_query="PRAGMA table_info('t')"))["rows"]
+
+
+def test_create_table_from_data_is_atomic(tools):
+    tools["create_table_from_data"](CreateTableInput(table_name="t", data=[{"a": 1}]))
+
+    # A value sqlite3 can't bind makes the insert fail after DROP/CREATE ran
+    result = tools["create_table_from_data"](CreateTableInput(table_name="t", data=[{"a": {1, 2}}]))
+    assert "error" in result
+
+    rows = tools["query_database"](QueryInput(sql_query="SELECT a FROM t"))["rows"]
+    assert rows == [{"a": 1}]
+
+
+def test_insert_aligns_rows_to_table_columns(tools):
+    tools["create_table_from_data"](CreateTableInput(table_name="t", data=[{"a": 1, "b-c": "x"}]))
+
+    # Missing columns become NULL, unknown keys are dropped, lists become JSON
+    tools["insert_data_into_table"](TableDataInput(table_name="t", data=[{"b c": [1, 2], "zzz": 9}]))
+
+    rows = tools["query_database"](QueryInput(sql_query="SELECT a, b_c FROM t"))["rows"]
+    assert rows == [{"a": 1, "b_c": "x"}, {"a": None, "b_c": "[1, 2]"}]
+
+
+def test_query_database_truncates_at_max_rows(tools, monkeypatch):
+    monkeypatch.setattr("src.db.queries.MAX_QUERY_ROWS", 3)
+    tools["create_table_from_data"](CreateTableInput(table_name="t", data=[{"a": i} for i in range(10)]))
+
+    result = tools["query_database"](QueryInput(sql_query="SELECT a FROM t ORDER BY a"))
+
+    assert result["rows"] == [{"a": 0}, {"a": 1}, {"a": 2}]
+    assert "truncated" in result["message"]
+    # The unfinished SELECT must not block a later write on the same connection
+    assert "success" in tools["drop_table"](TableNameInput(table_name="t"))
+
+
+def test_create_table_with_primary_key_and_date_index(tools):
+    data = [{"vector-id": "v1", "refPer": "2020-01-01"}, {"vector-id": "v2", "refPer": "2020-02-01"}]
+    result = tools["create_table_from_data"](CreateTableInput(table_name="t", data=data, primary_key="vector-id"))
+    assert "success" in result
+
+    schema = tools["get_table_schema"](TableNameInput(table_name="t"))["schema"]
+    assert [c["name"] for c in schema if c["primary_key"]] == ["vector_id"]
+    indexes = tools["query_database"](QueryInput(sql_query="PRAGMA index_list('t')"))["rows"]
+    assert "idx_t.refPer" in {row["name"] for row in indexes}
+
+
+def test_date_index_names_do_not_collide_across_tables(tools):
+    for table, column in (("t", "ref_date"), ("t_ref", "date")):
+        data = [{column: "2020-01-01"}]
+        assert "success" in tools["create_table_from_data"](CreateTableInput(table_name=table, data=data))
+
+    for table, column in (("t", "ref_date"), ("t_ref", "date")):
+        indexes = tools["query_database"](QueryInput(sql_query=f"PRAGMA index_list('{table}')"))["rows"]
+        assert [row["name"] for row in indexes] == [f"idx_{table}.{column}"]
+
+
+def test_create_table_rejects_unknown_primary_key(tools):
+    result = tools["create_table_from_data"](CreateTableInput(table_name="t", data=[{"a": 1}], primary_key="b"))
+    assert "error" in result
+
+
+def test_create_table_rejects_null_primary_key(tools):
+    data = [{"a": 1, "b": "x"}, {"a": None, "b": "y"}, {"b": "z"}]
+    result = tools["create_table_from_data"](CreateTableInput(table_name="t", data=data, primary_key="a"))
+    assert result == {"error": "primary_key 'a' is missing or null in 2 of 3 rows."}
+
+
+def test_primary_key_is_only_advertised_by_create_table():
+    registry = ToolRegistry()
+    register_db_tools(registry)
+    properties = {tool.name: tool.inputSchema["properties"] for tool in registry.get_tools()}
+    assert "primary_key" in properties["create_table_from_data"]
+    assert "primary_key" not in properties["insert_data_into_table"]
+
+
+def test_create_table_infers_type_past_leading_nulls(tools):
+    data = [{"a": None, "b": None}, {"a": 2, "b": None}, {"a": 3, "b": 1.5}]
+    tools["create_table_from_data"](CreateTableInput(table_name="t", data=data))
+
+    schema = tools["get_table_schema"](TableNameInput(table_name="t"))["schema"]
+    assert {c["name"]: c["type"] for c in schema} == {"a": "INTEGER", "b": "REAL"}
+
+
+def test_insert_sees_columns_of_recreated_table(tools):
+    tools["create_table_from_data"](CreateTableInput(table_name="t", data=[{"a": 1}]))
+    tools["insert_data_into_table"](TableDataInput(table_name="t", data=[{"a": 2}]))
+
+    # Recreate with different columns behind the column cache's back
+    with connection.get_db_connection() as conn:
+        conn.execute('DROP TABLE "t"')
+        conn.execute('CREATE TABLE "t" ("b" INTEGER)')
+
+    result = tools["insert_data_into_table"](TableDataInput(table_name="t", data=[{"a": 3, "b": 4}]))
+    assert "success" in result
+    rows = tools["query_database"](QueryInput(sql_query="SELECT * FROM t"))["rows"]
+    assert rows == [{"b": 4}]
+
+
+def test_inserts_span_multiple_batches(tools, monkeypatch):
+    # Two columns -> two rows per INSERT statement, so 5 rows need 3 batches
+    monkeypatch.setattr("src.db.schema._MAX_SQL_VARIABLES", 5)
+    data = [{"a": i, "b": str(i)} for i in range(5)]
+
+    assert tools["create_table_from_data"](CreateTableInput(table_name="t", data=data))["rows_inserted"] == 5
+    result = tools["insert_data_into_table"](TableDataInput(table_name="t", data=data[:3]))
+    assert result["success"].startswith("Inserted 3 rows")
+
+    rows = tools["query_database"](QueryInput(sql_query="SELECT a, b FROM t ORDER BY a, rowid"))["rows"]
+    assert [r["a"] for r in rows] == [0, 0, 1, 1, 2, 2, 3, 4]
@@ -0,0 +1,28 @@
+"""Tests for src/util/sql_helpers.py."""
+
+import pytest
+
+from src.util.sql_helpers import build_insert_sql, sanitize_column_name, sanitize_row_keys
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("refPer", ("refPer", True)),
+        ("GEO name-2", ("GEO_name_2", True)),
+        ("Géo", ("Géo", True)),  # non-ASCII letters are kept, as str.isalnum() did
+        ("2020", ("2020", False)),  # can't start with a digit
+        ("", ("", False)),
+    ],
+)
+def test_sanitize_column_name(key, expected):
+    assert sanitize_column_name(key) == expected
+
+
+def test_sanitize_row_keys_dedupes_and_drops_invalid():
+    assert sanitize_row_keys(["a b", "a-b", "1x", "a_b"]) == {"a_b": "a b", "a_b_1": "a-b", "a_b_2": "a_b"}
+
+
+def test_build_insert_sql():
+    assert build_insert_sql("t", ("a", "b_c")) == 'INSERT INTO "t" ("a", "b_c") VALUES (?, ?)'
+    assert build_insert_sql("t", ("a",), 3) == 'INSERT INTO "t" ("a") VALUES (?), (?), (?)'